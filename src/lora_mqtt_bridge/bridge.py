@@ -8,8 +8,13 @@ from __future__ import annotations
 
 import json
 import logging
+import re
+import selectors
 import signal
+import socket
+import sys
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 from lora_mqtt_bridge.clients.local import LocalMQTTClient
@@ -24,6 +29,24 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Downlink clear topics always end in ".../clear"; a compiled suffix match
+# avoids lowercasing the whole topic string for every remote message.
+_CLEAR_TOPIC_RE = re.compile(r"/clear$", re.IGNORECASE)
+
+# Precomputed lookup tables for topic classification; single dict probes
+# instead of chained comparisons on every message.
+_MESSAGE_TYPES_BY_PART = {
+    "up": MessageType.UPLINK,
+    "down": MessageType.DOWNLINK,
+    "joined": MessageType.JOINED,
+    "moved": MessageType.MOVED,
+    "clear": MessageType.CLEAR,
+}
+_TOPIC_FORMATS_BY_PREFIX = {
+    "lora": TopicFormat.LORA,
+    "scada": TopicFormat.SCADA,
+}
+
 
 class MQTTBridge:
     """Main MQTT bridge manager.
@@ -37,6 +60,18 @@ class MQTTBridge:
         remote_clients: Dictionary of remote broker clients by name.
     """
 
+    __slots__ = (
+        "config",
+        "local_client",
+        "remote_clients",
+        "_fanout_executor",
+        "_forwarders_by_format",
+        "_running",
+        "_shutdown_event",
+        "_targets_by_format",
+        "_wakeup_w",
+    )
+
     def __init__(self, config: BridgeConfig) -> None:
         """Initialize the MQTT bridge.
 
@@ -46,6 +81,15 @@ class MQTTBridge:
         self.config = config
         self._running = False
         self._shutdown_event = threading.Event()
+        # Write end of the run loop's wakeup socketpair; set while
+        # _run_wakeup_fd_loop is active so stop() can wake select()
+        self._wakeup_w: socket.socket | None = None
+
+        # Optional worker pool so fan-out to many remotes can overlap;
+        # with the default of 1 worker, forwarding stays inline. Created
+        # in start() and torn down in stop() so the bridge survives a
+        # stop()/start() cycle.
+        self._fanout_executor: ThreadPoolExecutor | None = None
 
         # Create local client
         self.local_client = LocalMQTTClient(config.local_broker)
@@ -60,6 +104,27 @@ class MQTTBridge:
                 self.remote_clients[remote_config.name] = client
                 logger.info("Configured remote broker: %s", remote_config.name)
 
+        self._rebuild_forwarders()
+
+    def _rebuild_forwarders(self) -> None:
+        """Rebuild the per-format forwarding tables.
+
+        Precomputes which remote clients receive each source topic format,
+        along with their bound forward_message callables, so the per-message
+        loop avoids the membership test and attribute lookup per broker.
+        Must be called whenever remote_clients changes.
+        """
+        targets: dict[TopicFormat, list[RemoteMQTTClient]] = {fmt: [] for fmt in TopicFormat}
+        for client in self.remote_clients.values():
+            for fmt in TopicFormat:
+                if client.config.accepts_format(fmt):
+                    targets[fmt].append(client)
+        self._targets_by_format = {fmt: tuple(clients) for fmt, clients in targets.items()}
+        self._forwarders_by_format = {
+            fmt: tuple(client.forward_message for client in clients)
+            for fmt, clients in self._targets_by_format.items()
+        }
+
     def start(self) -> None:
         """Start the MQTT bridge.
 
@@ -68,6 +133,12 @@ class MQTTBridge:
         logger.info("Starting MQTT bridge")
         self._running = True
 
+        if self.config.fanout_workers > 1 and self._fanout_executor is None:
+            self._fanout_executor = ThreadPoolExecutor(
+                max_workers=self.config.fanout_workers,
+                thread_name_prefix="fanout",
+            )
+
         # Get status writer
         status_writer = get_status_writer()
 
@@ -103,6 +174,15 @@ class MQTTBridge:
         self._running = False
         self._shutdown_event.set()
 
+        # Programmatic stop: wake the run loop if it is blocked in
+        # select(); signals do this themselves via the wakeup fd
+        wakeup_w = self._wakeup_w
+        if wakeup_w is not None:
+            try:
+                wakeup_w.send(b"\0")
+            except OSError:
+                pass
+
         # Disconnect from remote brokers
         for name, client in self.remote_clients.items():
             try:
@@ -118,6 +198,13 @@ class MQTTBridge:
         except Exception:
             logger.exception("Error disconnecting from local broker")
 
+        # Tear the fan-out pool down only after the local client has
+        # disconnected: an uplink arriving mid-stop must not hit a
+        # shut-down executor. start() recreates it.
+        if self._fanout_executor is not None:
+            self._fanout_executor.shutdown(wait=True)
+            self._fanout_executor = None
+
         logger.info("MQTT bridge stopped")
 
     def run(self) -> None:
@@ -133,13 +220,51 @@ class MQTTBridge:
 
         logger.info("MQTT bridge running. Press Ctrl+C to stop.")
 
+        try:
+            if sys.platform == "linux":
+                self._run_wakeup_fd_loop()
+            else:
+                while self._running:
+                    # Periodic health check
+                    self._health_check()
+                    self._shutdown_event.wait(timeout=5.0)
+        finally:
+            self.stop()
+
+    def _run_wakeup_fd_loop(self) -> None:
+        """Run the health-check loop driven by a signal wakeup fd.
+
+        Instead of polling a threading.Event, block in selector.select() on a
+        socketpair registered as the interpreter's signal wakeup fd. A SIGINT
+        or SIGTERM writes a byte to the pair, so shutdown interrupts the wait
+        immediately while the 5 second timeout still drives health checks.
+        stop() writes to the same pair, so programmatic shutdown from
+        another thread wakes the loop just as fast.
+        """
+        wakeup_r, wakeup_w = socket.socketpair()
+        wakeup_r.setblocking(False)
+        wakeup_w.setblocking(False)
+        old_wakeup_fd = signal.set_wakeup_fd(wakeup_w.fileno())
+        self._wakeup_w = wakeup_w
+
+        selector = selectors.DefaultSelector()
+        selector.register(wakeup_r, selectors.EVENT_READ)
         try:
             while self._running:
-                # Periodic health check
                 self._health_check()
-                self._shutdown_event.wait(timeout=5.0)
+                if selector.select(timeout=5.0):
+                    # Drain the wakeup bytes; the Python-level signal handler
+                    # has already run and updated self._running.
+                    try:
+                        wakeup_r.recv(128)
+                    except (BlockingIOError, InterruptedError):
+                        pass
         finally:
-            self.stop()
+            self._wakeup_w = None
+            signal.set_wakeup_fd(old_wakeup_fd)
+            selector.close()
+            wakeup_r.close()
+            wakeup_w.close()
 
     def _signal_handler(self, signum: int, frame: Any) -> None:
         """Handle shutdown signals.
@@ -176,23 +301,29 @@ class MQTTBridge:
             topic: The MQTT topic.
             payload: The message payload.
         """
-        logger.debug("Received local message on topic: %s", topic)
+        # Hoisted so debug-only format arguments are never built in production
+        # (logging evaluates arguments eagerly even when DEBUG is disabled).
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Received local message on topic: %s", topic)
 
         # Parse message type from topic
         message_type = self._parse_message_type(topic)
         if message_type is None:
-            logger.debug("Unknown message type for topic: %s", topic)
+            if debug:
+                logger.debug("Unknown message type for topic: %s", topic)
             return
 
         # Determine the source topic format (lora or scada)
         source_format = self._get_source_topic_format(topic)
         if source_format is None:
-            logger.debug("Unknown topic format for topic: %s", topic)
+            if debug:
+                logger.debug("Unknown topic format for topic: %s", topic)
             return
 
-        # Parse payload
+        # Parse payload (json.loads accepts bytes directly; no separate decode pass)
         try:
-            data = json.loads(payload.decode("utf-8"))
+            data = json.loads(payload)
         except (json.JSONDecodeError, UnicodeDecodeError):
             logger.error("Failed to parse message payload")
             return
@@ -212,29 +343,25 @@ class MQTTBridge:
         # Forward to remote brokers that are configured to receive this topic format
         forwarded_count = 0
         status_writer = get_status_writer()
-        for name, client in self.remote_clients.items():
-            # Check if this remote broker wants this source topic format
-            if source_format not in client.config.source_topic_format:
-                logger.debug(
-                    "Skipping %s for broker %s (format %s not in %s)",
-                    message.deveui,
-                    name,
-                    source_format.value,
-                    [f.value for f in client.config.source_topic_format],
-                )
-                continue
-
-            if client.forward_message(message):
+        forwarders = self._forwarders_by_format[source_format]
+        if self._fanout_executor is not None and len(forwarders) > 1:
+            # Overlap the per-remote filter + publish work across workers
+            results = self._fanout_executor.map(lambda forward: forward(message), forwarders)
+        else:
+            results = (forward(message) for forward in forwarders)
+        for forwarded in results:
+            if forwarded:
                 forwarded_count += 1
                 status_writer.increment_message_count()
 
-        logger.debug(
-            "Message from %s (%s) forwarded to %d/%d remote brokers",
-            message.deveui,
-            source_format.value,
-            forwarded_count,
-            len(self.remote_clients),
-        )
+        if debug:
+            logger.debug(
+                "Message from %s (%s) forwarded to %d/%d remote brokers",
+                message.deveui,
+                source_format.value,
+                forwarded_count,
+                len(self.remote_clients),
+            )
 
     def _handle_remote_message(self, topic: str, payload: bytes) -> None:
         """Handle messages received from remote brokers (downlinks).
@@ -245,9 +372,9 @@ class MQTTBridge:
         """
         logger.debug("Received remote message on topic: %s", topic)
 
-        # Parse payload
+        # Parse payload (json.loads accepts bytes directly; no separate decode pass)
         try:
-            data = json.loads(payload.decode("utf-8"))
+            data = json.loads(payload)
         except (json.JSONDecodeError, UnicodeDecodeError):
             logger.error("Failed to parse downlink payload")
             return
@@ -260,7 +387,7 @@ class MQTTBridge:
         deveui = data["deveui"]
 
         # Check if this is a clear command or downlink
-        if "clear" in topic.lower():
+        if _CLEAR_TOPIC_RE.search(topic) is not None:
             logger.info("Processing queue clear for %s", deveui)
             self.local_client.publish_clear(deveui)
         else:
@@ -276,21 +403,11 @@ class MQTTBridge:
         Returns:
             The MessageType or None if unknown.
         """
-        parts = topic.split("/")
-
         # Find the event type in the topic
-        for part in parts:
-            part_lower = part.lower()
-            if part_lower == "up":
-                return MessageType.UPLINK
-            elif part_lower == "down":
-                return MessageType.DOWNLINK
-            elif part_lower == "joined":
-                return MessageType.JOINED
-            elif part_lower == "moved":
-                return MessageType.MOVED
-            elif part_lower == "clear":
-                return MessageType.CLEAR
+        for part in topic.split("/"):
+            message_type = _MESSAGE_TYPES_BY_PART.get(part.lower())
+            if message_type is not None:
+                return message_type
 
         return None
 
@@ -303,17 +420,8 @@ class MQTTBridge:
         Returns:
             TopicFormat.LORA, TopicFormat.SCADA, or None if unknown.
         """
-        parts = topic.split("/")
-        if not parts:
-            return None
-
-        prefix = parts[0].lower()
-        if prefix == "lora":
-            return TopicFormat.LORA
-        elif prefix == "scada":
-            return TopicFormat.SCADA
-
-        return None
+        prefix, _, _ = topic.partition("/")
+        return _TOPIC_FORMATS_BY_PREFIX.get(prefix.lower())
 
     def get_status(self) -> dict[str, Any]:
         """Get the current status of the bridge.
@@ -359,6 +467,7 @@ class MQTTBridge:
                 return
 
         self.remote_clients[config.name] = client
+        self._rebuild_forwarders()
         logger.info("Added remote broker: %s", config.name)
 
     def remove_remote_broker(self, name: str) -> bool:
@@ -375,6 +484,7 @@ class MQTTBridge:
             return False
 
         client = self.remote_clients.pop(name)
+        self._rebuild_forwarders()
         try:
             client.disconnect()
         except Exception:
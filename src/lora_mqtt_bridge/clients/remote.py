@@ -114,9 +114,10 @@ class RemoteMQTTClient(BaseMQTTClient):
         payload_str = json.dumps(filtered_payload)
 
         # Publish or queue the message
-        if self.is_connected:
+        if self._connected:
             try:
-                self.publish(topic, payload_str, self.config.qos, self.config.retain)
+                config = self.config
+                self.publish(topic, payload_str, config.qos, config.retain)
                 logger.debug(
                     "Forwarded message from %s to %s",
                     message.deveui,
@@ -209,7 +210,7 @@ class RemoteMQTTClient(BaseMQTTClient):
             Parsed downlink message dict or None if invalid.
         """
         try:
-            data = json.loads(payload.decode("utf-8"))
+            data: dict[str, Any] = json.loads(payload)
             if "deveui" not in data:
                 logger.error("Downlink missing deveui field")
                 return None
@@ -219,7 +220,8 @@ class RemoteMQTTClient(BaseMQTTClient):
                 data.get("deveui"),
                 self.name,
             )
-            return dict(data)
+            # json.loads already returned a fresh dict; no defensive copy needed
+            return data
         except json.JSONDecodeError:
             logger.error("Failed to parse downlink payload as JSON")
             return None
@@ -10,6 +10,8 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from lora_mqtt_bridge.models.config import FieldFilterConfig
 
 
@@ -37,34 +39,24 @@ class FieldFilter:
         self._exclude_fields = set(config.exclude_fields)
         self._always_include = set(config.always_include)
 
-    def filter_payload(self, payload: dict[str, Any]) -> dict[str, Any]:
+    def filter_payload(self, payload: Mapping[str, Any]) -> dict[str, Any]:
         """Filter a message payload based on configured rules.
 
         Args:
-            payload: The original message payload dictionary.
+            payload: The original message payload mapping.
 
         Returns:
             A filtered payload dictionary.
         """
-        result: dict[str, Any] = {}
-
-        for key, value in payload.items():
-            # Always include required fields
-            if key in self._always_include:
-                result[key] = value
-                continue
-
-            # Check exclude list first
-            if key in self._exclude_fields:
-                logger.debug("Excluding field: %s", key)
-                continue
-
-            # Check include list (empty = include all not excluded)
-            if self._include_fields and key not in self._include_fields:
-                logger.debug("Field not in include list: %s", key)
-                continue
-
-            result[key] = value
+        keys = payload.keys()
+        # C-level set algebra: restrict to the include list (empty =
+        # include all), drop excluded keys, then re-add always-include
+        # fields, which win over both lists
+        keep = (keys & self._include_fields) if self._include_fields else keys
+        keep = (keep - self._exclude_fields) | (keys & self._always_include)
+
+        # One pass over the payload keeps the original field order
+        result = {key: value for key, value in payload.items() if key in keep}
 
         logger.debug(
             "Filtered payload from %d to %d fields",
@@ -12,8 +12,16 @@ Supports three types of filtering:
 from __future__ import annotations
 
 import logging
+from bisect import bisect_right
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
+from lora_mqtt_bridge.models.config import (
+    _CANONICAL_EUI_RE,
+    _eui_to_int,
+    _normalize_eui,
+)
+
 if TYPE_CHECKING:
     from lora_mqtt_bridge.models.config import EUIMask, EUIRange, MessageFilterConfig
     from lora_mqtt_bridge.models.message import LoRaMessage
@@ -22,6 +30,80 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+# Bound on the per-filter forwarding-decision cache; sized for the
+# device-fleet working set of a single gateway
+_DECISION_CACHE_SIZE = 256
+
+
+def _range_bounds(
+    ranges: list[EUIRange],
+) -> tuple[tuple[int, ...], tuple[int, ...]] | tuple[()]:
+    """Compile EUI ranges into sorted, disjoint bounds for binary search.
+
+    Overlapping and adjacent ranges are merged, so a lookup is one
+    bisect over the lower bounds plus a single compare against the
+    matching upper bound regardless of how the ranges were configured.
+
+    Args:
+        ranges: List of EUIRange objects.
+
+    Returns:
+        A (lower_bounds, upper_bounds) pair of parallel sorted tuples,
+        or an empty tuple if there are no ranges.
+    """
+    if not ranges:
+        return ()
+    merged: list[list[int]] = []
+    for lo, hi in sorted((r.min_int, r.max_int) for r in ranges):
+        if merged and lo <= merged[-1][1] + 1:
+            if hi > merged[-1][1]:
+                merged[-1][1] = hi
+        else:
+            merged.append([lo, hi])
+    return tuple(m[0] for m in merged), tuple(m[1] for m in merged)
+
+
+def _mask_groups(masks: list[EUIMask]) -> tuple[tuple[int, frozenset[int]], ...]:
+    """Group EUI masks by mask_int for batched matching.
+
+    Masks sharing the same wildcard positions collapse into one AND plus a
+    set membership test, so matching costs one step per distinct mask shape
+    rather than one per mask.
+
+    Args:
+        masks: List of EUIMask objects.
+
+    Returns:
+        Tuple of (mask_int, targets) pairs where targets holds every
+        target_int that shares the mask.
+    """
+    targets_by_mask: dict[int, set[int]] = {}
+    for m in masks:
+        targets_by_mask.setdefault(m.mask_int, set()).add(m.target_int)
+    return tuple((mask_int, frozenset(targets)) for mask_int, targets in targets_by_mask.items())
+
+
+def _eui_int_set(euis: set[str]) -> frozenset[int]:
+    """Convert a set of normalized EUI strings to integer keys.
+
+    Entries that are not valid EUIs are skipped; they can only match via
+    the string fallback path, which is preserved for such values.
+
+    Args:
+        euis: Set of normalized EUI strings.
+
+    Returns:
+        Frozenset of integer EUI keys.
+    """
+    result = set()
+    for eui in euis:
+        try:
+            result.add(_eui_to_int(eui))
+        except ValueError:
+            pass
+    return frozenset(result)
+
+
 class MessageFilter:
     """Filter messages based on device identifiers.
 
@@ -59,6 +141,60 @@ class MessageFilter:
         self._appeui_ranges: list[EUIRange] = list(config.appeui_ranges)
         self._appeui_masks: list[EUIMask] = list(config.appeui_masks)
 
+        # Decision cache: back-to-back uplinks from the same device skip
+        # the full filter evaluation. The generation counter in each key
+        # implicitly invalidates entries when filters are mutated.
+        self._decision_gen = 0
+        self._decision_cache: OrderedDict[tuple[int, str, str | None, str | None], bool] = (
+            OrderedDict()
+        )
+
+        # Precomputed integer tables for the filter hot path
+        self._joineui_whitelist_ints = _eui_int_set(self._joineui_whitelist)
+        self._joineui_blacklist_ints = _eui_int_set(self._joineui_blacklist)
+        self._joineui_range_bounds = _range_bounds(self._joineui_ranges)
+        self._joineui_mask_groups = _mask_groups(self._joineui_masks)
+        self._appeui_whitelist_ints = _eui_int_set(self._appeui_whitelist)
+        self._appeui_blacklist_ints = _eui_int_set(self._appeui_blacklist)
+        self._appeui_range_bounds = _range_bounds(self._appeui_ranges)
+        self._appeui_mask_groups = _mask_groups(self._appeui_masks)
+        self._joineui_has_filters = bool(
+            self._joineui_whitelist
+            or self._joineui_blacklist
+            or self._joineui_ranges
+            or self._joineui_masks
+        )
+        self._appeui_has_filters = bool(
+            self._appeui_whitelist
+            or self._appeui_blacklist
+            or self._appeui_ranges
+            or self._appeui_masks
+        )
+        self._rebuild_deveui_tables()
+
+    def _rebuild_deveui_tables(self) -> None:
+        """Rebuild the precomputed DevEUI integer tables.
+
+        Must be called after the DevEUI whitelist, blacklist, range, or mask
+        collections are mutated.
+        """
+        # Stale cached decisions stop matching once the generation moves
+        self._decision_gen += 1
+        self._deveui_whitelist_ints = _eui_int_set(self._deveui_whitelist)
+        self._deveui_blacklist_ints = _eui_int_set(self._deveui_blacklist)
+        self._deveui_range_bounds = _range_bounds(self._deveui_ranges)
+        self._deveui_mask_groups = _mask_groups(self._deveui_masks)
+        self._deveui_has_filters = bool(
+            self._deveui_whitelist
+            or self._deveui_blacklist
+            or self._deveui_ranges
+            or self._deveui_masks
+        )
+        # With no filters configured anywhere, should_forward is a single branch
+        self._is_passthrough = not (
+            self._deveui_has_filters or self._joineui_has_filters or self._appeui_has_filters
+        )
+
     def _normalize_eui(self, eui: str | None) -> str | None:
         """Normalize an EUI value for comparison.
 
@@ -70,38 +206,45 @@ class MessageFilter:
         """
         if eui is None:
             return None
-        clean = eui.replace(":", "").replace("-", "").lower()
-        if len(clean) == 16:
-            return "-".join([clean[i : i + 2] for i in range(0, 16, 2)])
-        return eui.lower()
-
-    def _check_ranges(self, value: str, ranges: list[EUIRange]) -> bool:
-        """Check if a value falls within any of the specified ranges.
+        # Fast path: LoRaMessage normalizes on construction, so filter input
+        # is almost always canonical already
+        if _CANONICAL_EUI_RE.fullmatch(eui):
+            return eui
+        # Delegate to the cached module-level normalizer
+        return _normalize_eui(eui)
+
+    def _check_ranges(
+        self,
+        eui_int: int,
+        bounds: tuple[tuple[int, ...], tuple[int, ...]],
+    ) -> bool:
+        """Check if an EUI integer falls within any of the compiled ranges.
 
         Args:
-            value: The EUI value to check (already normalized).
-            ranges: List of EUIRange objects to check against.
+            eui_int: The integer EUI value to check.
+            bounds: Compiled (lower_bounds, upper_bounds) from _range_bounds.
 
         Returns:
             True if the value is within any range, False otherwise.
         """
-        for eui_range in ranges:
-            if eui_range.contains(value):
-                return True
-        return False
+        lower_bounds, upper_bounds = bounds
+        # Ranges are sorted and disjoint: the only candidate is the last
+        # range starting at or below eui_int
+        i = bisect_right(lower_bounds, eui_int) - 1
+        return i >= 0 and eui_int <= upper_bounds[i]
 
-    def _check_masks(self, value: str, masks: list[EUIMask]) -> bool:
-        """Check if a value matches any of the specified masks.
+    def _check_masks(self, eui_int: int, groups: tuple[tuple[int, frozenset[int]], ...]) -> bool:
+        """Check if an EUI integer matches any of the specified masks.
 
         Args:
-            value: The EUI value to check (already normalized).
-            masks: List of EUIMask objects to check against.
+            eui_int: The integer EUI value to check.
+            groups: Tuple of (mask_int, targets) groups to check against.
 
         Returns:
             True if the value matches any mask, False otherwise.
         """
-        for eui_mask in masks:
-            if eui_mask.matches(value):
+        for mask_int, targets in groups:
+            if eui_int & mask_int in targets:
                 return True
         return False
 
@@ -109,41 +252,79 @@ class MessageFilter:
         self,
         value: str | None,
         whitelist: set[str],
+        whitelist_ints: frozenset[int],
         blacklist: set[str],
-        ranges: list[EUIRange],
-        masks: list[EUIMask],
+        blacklist_ints: frozenset[int],
+        range_bounds: tuple[tuple[int, ...], tuple[int, ...]] | tuple[()],
+        mask_groups: tuple[tuple[int, frozenset[int]], ...],
         field_name: str,
+        eui_int: int | None = None,
+        debug: bool = True,
     ) -> bool:
         """Check if a value passes whitelist/blacklist/range/mask filtering.
 
         Args:
             value: The value to check.
             whitelist: The set of allowed values (empty = allow all).
+            whitelist_ints: Integer keys of whitelist entries.
             blacklist: The set of blocked values.
-            ranges: List of allowed EUI ranges.
-            masks: List of allowed EUI mask patterns.
+            blacklist_ints: Integer keys of blacklist entries.
+            range_bounds: Compiled EUI range bounds from _range_bounds.
+            mask_groups: Allowed (mask_int, targets) EUI mask groups.
             field_name: Name of the field for logging.
+            eui_int: Precomputed integer form of value, if the caller has one.
+            debug: Whether debug logging is enabled; skips building log
+                arguments on the hot path when False.
 
         Returns:
             True if the value passes filtering, False otherwise.
         """
         # Determine if any allow filters are active
-        has_allow_filters = bool(whitelist or ranges or masks)
+        has_allow_filters = bool(whitelist or range_bounds or mask_groups)
 
         if value is None:
             # If no value provided and allow filters exist, fail
             if has_allow_filters:
-                logger.debug("No %s provided and allow filters are active", field_name)
+                if debug:
+                    logger.debug("No %s provided and allow filters are active", field_name)
                 return False
             return True
 
-        normalized = self._normalize_eui(value)
-        if normalized is None:
+        normalized: str | None
+        if eui_int is not None:
+            # Caller supplied a pre-parsed integer; value is already canonical
+            normalized = value
+        else:
+            normalized = self._normalize_eui(value)
+            if normalized is None:
+                return False
+
+            # Convert once; all hot-path membership tests run on integer keys
+            try:
+                eui_int = _eui_to_int(normalized)
+            except ValueError:
+                eui_int = None
+
+        if eui_int is None:
+            # Non-EUI value: fall back to string comparison
+            if normalized in blacklist:
+                if debug:
+                    logger.debug("%s %s is blacklisted", field_name, normalized)
+                return False
+            if not has_allow_filters:
+                return True
+            if normalized in whitelist:
+                if debug:
+                    logger.debug("%s %s matched whitelist", field_name, normalized)
+                return True
+            if debug:
+                logger.debug("%s %s not in any allow filter", field_name, normalized)
             return False
 
         # Check blacklist first (always blocks)
-        if normalized in blacklist:
-            logger.debug("%s %s is blacklisted", field_name, normalized)
+        if eui_int in blacklist_ints:
+            if debug:
+                logger.debug("%s %s is blacklisted", field_name, normalized)
             return False
 
         # If no allow filters defined, allow all (subject to blacklist)
@@ -151,22 +332,26 @@ class MessageFilter:
             return True
 
         # Check whitelist exact match
-        if whitelist and normalized in whitelist:
-            logger.debug("%s %s matched whitelist", field_name, normalized)
+        if eui_int in whitelist_ints:
+            if debug:
+                logger.debug("%s %s matched whitelist", field_name, normalized)
             return True
 
         # Check range filters
-        if ranges and self._check_ranges(normalized, ranges):
-            logger.debug("%s %s matched range filter", field_name, normalized)
+        if range_bounds and self._check_ranges(eui_int, range_bounds):
+            if debug:
+                logger.debug("%s %s matched range filter", field_name, normalized)
             return True
 
         # Check mask patterns
-        if masks and self._check_masks(normalized, masks):
-            logger.debug("%s %s matched mask pattern", field_name, normalized)
+        if mask_groups and self._check_masks(eui_int, mask_groups):
+            if debug:
+                logger.debug("%s %s matched mask pattern", field_name, normalized)
             return True
 
         # Value didn't match any allow filter
-        logger.debug("%s %s not in any allow filter", field_name, normalized)
+        if debug:
+            logger.debug("%s %s not in any allow filter", field_name, normalized)
         return False
 
     def should_forward(self, message: LoRaMessage) -> bool:
@@ -178,41 +363,86 @@ class MessageFilter:
         Returns:
             True if the message should be forwarded, False otherwise.
         """
+        # Fast path: no filters configured, everything is forwarded
+        if self._is_passthrough:
+            return True
+
+        # LoRa traffic has strong temporal locality: the same device
+        # transmits back-to-back, so repeats resolve from the cache
+        key = (self._decision_gen, message.deveui, message.joineui, message.appeui)
+        cached = self._decision_cache.get(key)
+        if cached is not None:
+            self._decision_cache.move_to_end(key)
+            return cached
+
+        allowed = self._evaluate(message)
+        self._decision_cache[key] = allowed
+        if len(self._decision_cache) > _DECISION_CACHE_SIZE:
+            self._decision_cache.popitem(last=False)
+        return allowed
+
+    def _evaluate(self, message: LoRaMessage) -> bool:
+        """Run the full filter chain for a message.
+
+        Args:
+            message: The LoRa message to check.
+
+        Returns:
+            True if the message should be forwarded, False otherwise.
+        """
+        # Hoisted so debug-only format arguments are never built in
+        # production (logging evaluates arguments eagerly even when
+        # DEBUG is disabled)
+        debug = logger.isEnabledFor(logging.DEBUG)
+
         # Check DevEUI
-        if not self._check_whitelist(
+        if self._deveui_has_filters and not self._check_whitelist(
             message.deveui,
             self._deveui_whitelist,
+            self._deveui_whitelist_ints,
             self._deveui_blacklist,
-            self._deveui_ranges,
-            self._deveui_masks,
+            self._deveui_blacklist_ints,
+            self._deveui_range_bounds,
+            self._deveui_mask_groups,
             "DevEUI",
+            eui_int=message.deveui_int if message.deveui_int >= 0 else None,
+            debug=debug,
         ):
             return False
 
         # Check JoinEUI
         joineui = message.get_effective_joineui()
-        if not self._check_whitelist(
+        if self._joineui_has_filters and not self._check_whitelist(
             joineui,
             self._joineui_whitelist,
+            self._joineui_whitelist_ints,
             self._joineui_blacklist,
-            self._joineui_ranges,
-            self._joineui_masks,
+            self._joineui_blacklist_ints,
+            self._joineui_range_bounds,
+            self._joineui_mask_groups,
             "JoinEUI",
+            eui_int=message.joineui_int if message.joineui_int >= 0 else None,
+            debug=debug,
         ):
             return False
 
         # Check AppEUI
-        if not self._check_whitelist(
+        if self._appeui_has_filters and not self._check_whitelist(
             message.appeui,
             self._appeui_whitelist,
+            self._appeui_whitelist_ints,
             self._appeui_blacklist,
-            self._appeui_ranges,
-            self._appeui_masks,
+            self._appeui_blacklist_ints,
+            self._appeui_range_bounds,
+            self._appeui_mask_groups,
             "AppEUI",
+            eui_int=message.appeui_int if message.appeui_int >= 0 else None,
+            debug=debug,
         ):
             return False
 
-        logger.debug("Message from DevEUI %s passed all filters", message.deveui)
+        if debug:
+            logger.debug("Message from DevEUI %s passed all filters", message.deveui)
         return True
 
     def add_to_deveui_whitelist(self, deveui: str) -> None:
@@ -224,6 +454,7 @@ class MessageFilter:
         normalized = self._normalize_eui(deveui)
         if normalized:
             self._deveui_whitelist.add(normalized)
+            self._rebuild_deveui_tables()
             logger.info("Added DevEUI %s to whitelist", normalized)
 
     def remove_from_deveui_whitelist(self, deveui: str) -> None:
@@ -235,6 +466,7 @@ class MessageFilter:
         normalized = self._normalize_eui(deveui)
         if normalized:
             self._deveui_whitelist.discard(normalized)
+            self._rebuild_deveui_tables()
             logger.info("Removed DevEUI %s from whitelist", normalized)
 
     def add_to_deveui_blacklist(self, deveui: str) -> None:
@@ -246,6 +478,7 @@ class MessageFilter:
         normalized = self._normalize_eui(deveui)
         if normalized:
             self._deveui_blacklist.add(normalized)
+            self._rebuild_deveui_tables()
             logger.info("Added DevEUI %s to blacklist", normalized)
 
     def remove_from_deveui_blacklist(self, deveui: str) -> None:
@@ -257,6 +490,7 @@ class MessageFilter:
         normalized = self._normalize_eui(deveui)
         if normalized:
             self._deveui_blacklist.discard(normalized)
+            self._rebuild_deveui_tables()
             logger.info("Removed DevEUI %s from blacklist", normalized)
 
     def add_deveui_range(self, min_eui: str, max_eui: str) -> None:
@@ -270,6 +504,7 @@ class MessageFilter:
 
         eui_range = EUIRange(min_eui=min_eui, max_eui=max_eui)
         self._deveui_ranges.append(eui_range)
+        self._rebuild_deveui_tables()
         logger.info("Added DevEUI range %s to %s", min_eui, max_eui)
 
     def remove_deveui_range(self, min_eui: str, max_eui: str) -> bool:
@@ -289,6 +524,7 @@ class MessageFilter:
         for i, eui_range in enumerate(self._deveui_ranges):
             if eui_range.min_eui == norm_min and eui_range.max_eui == norm_max:
                 self._deveui_ranges.pop(i)
+                self._rebuild_deveui_tables()
                 logger.info("Removed DevEUI range %s to %s", min_eui, max_eui)
                 return True
         return False
@@ -303,6 +539,7 @@ class MessageFilter:
 
         eui_mask = EUIMask.from_string(mask_pattern)
         self._deveui_masks.append(eui_mask)
+        self._rebuild_deveui_tables()
         logger.info("Added DevEUI mask pattern %s", mask_pattern)
 
     def remove_deveui_mask(self, mask_pattern: str) -> bool:
@@ -317,6 +554,7 @@ class MessageFilter:
         for i, eui_mask in enumerate(self._deveui_masks):
             if eui_mask.pattern.lower() == mask_pattern.lower():
                 self._deveui_masks.pop(i)
+                self._rebuild_deveui_tables()
                 logger.info("Removed DevEUI mask pattern %s", mask_pattern)
                 return True
         return False
@@ -8,8 +8,11 @@ Compatible with Python 3.10+ without external dependencies (no pydantic).
 
 from __future__ import annotations
 
+import re
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
 
@@ -20,6 +23,22 @@ class TopicFormat(str, Enum):
     SCADA = "scada"
 
 
+# One bit per topic format, for bitmask membership tests
+_TOPIC_FORMAT_BITS = {fmt: 1 << i for i, fmt in enumerate(TopicFormat)}
+
+# Shared read-only defaults, so instances don't each allocate a list
+_DEFAULT_ALWAYS_INCLUDE = ("deveui", "appeui", "time")
+_DEFAULT_SOURCE_FORMAT = (TopicFormat.LORA,)
+
+
+# Canonical form: 8 lowercase hex byte pairs joined by dashes
+_CANONICAL_EUI_RE = re.compile(r"[0-9a-f]{2}(?:-[0-9a-f]{2}){7}")
+
+# Strips EUI separators and lowercases hex digits in one C-level pass
+_EUI_NORM_TBL = str.maketrans("ABCDEF", "abcdef", ":-")
+
+
+@lru_cache(maxsize=4096)
 def _normalize_eui(eui: str) -> str:
     """Normalize EUI values to lowercase with dashes.
 
@@ -29,9 +48,17 @@ def _normalize_eui(eui: str) -> str:
     Returns:
         The normalized EUI string.
     """
-    clean = eui.replace(":", "").replace("-", "").lower()
+    # Fast path: already canonical, no string rebuilding needed
+    if _CANONICAL_EUI_RE.fullmatch(eui):
+        return eui
+    clean = eui.translate(_EUI_NORM_TBL)
     if len(clean) == 16:
-        return "-".join([clean[i : i + 2] for i in range(0, 16, 2)])
+        try:
+            # Single C call that emits the dashed byte-pair form
+            return bytes.fromhex(clean).hex("-")
+        except ValueError:
+            # Non-hex 16-char value: keep the historical dashed form
+            return "-".join([clean[i : i + 2] for i in range(0, 16, 2)])
     return eui.lower()
 
 
@@ -47,6 +74,7 @@ def _normalize_eui_list(eui_list: list[str]) -> list[str]:
     return [_normalize_eui(eui) for eui in eui_list]
 
 
+@lru_cache(maxsize=4096)
 def _eui_to_int(eui: str) -> int:
     """Convert a normalized EUI string to an integer for range comparison.
 
@@ -56,8 +84,8 @@ def _eui_to_int(eui: str) -> int:
     Returns:
         The integer representation of the EUI.
     """
-    clean = eui.replace("-", "").replace(":", "").lower()
-    return int(clean, 16)
+    # bytes.fromhex + int.from_bytes run in C, beating int(str, 16)
+    return int.from_bytes(bytes.fromhex(eui.translate(_EUI_NORM_TBL)), "big")
 
 
 def _parse_eui_range(range_spec: list[str]) -> tuple[int, int]:
@@ -79,6 +107,12 @@ def _parse_eui_range(range_spec: list[str]) -> tuple[int, int]:
     return (_eui_to_int(min_eui), _eui_to_int(max_eui))
 
 
+# Translation tables for mask parsing: wildcards become '0' in the pattern,
+# hex digits become 'f' (and wildcards '0') in the mask
+_MASK_PATTERN_TBL = str.maketrans("x", "0")
+_MASK_BITS_TBL = str.maketrans("0123456789abcdefx", "ffffffffffffffff0")
+
+
 def _parse_eui_mask(mask_spec: str) -> tuple[str, str]:
     """Parse an EUI mask specification.
 
@@ -93,23 +127,11 @@ def _parse_eui_mask(mask_spec: str) -> tuple[str, str]:
         with wildcards replaced by '0' and mask indicates which positions matter.
     """
     normalized = _normalize_eui(mask_spec.lower())
-    # Build a pattern and mask
-    pattern_chars = []
-    mask_chars = []
-    for char in normalized:
-        if char == "x":
-            pattern_chars.append("0")
-            mask_chars.append("0")
-        elif char == "-":
-            pattern_chars.append("-")
-            mask_chars.append("-")
-        else:
-            pattern_chars.append(char)
-            mask_chars.append("f")
-    return ("".join(pattern_chars), "".join(mask_chars))
+    # str.translate runs in C, avoiding a Python char-by-char loop
+    return (normalized.translate(_MASK_PATTERN_TBL), normalized.translate(_MASK_BITS_TBL))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EUIRange:
     """Represents an EUI range for filtering.
 
@@ -127,10 +149,11 @@ class EUIRange:
 
     def __post_init__(self) -> None:
         """Calculate integer representations after initialization."""
-        self.min_eui = _normalize_eui(self.min_eui)
-        self.max_eui = _normalize_eui(self.max_eui)
-        self.min_int = _eui_to_int(self.min_eui)
-        self.max_int = _eui_to_int(self.max_eui)
+        # object.__setattr__ is the standard escape hatch for frozen dataclasses
+        object.__setattr__(self, "min_eui", _normalize_eui(self.min_eui))
+        object.__setattr__(self, "max_eui", _normalize_eui(self.max_eui))
+        object.__setattr__(self, "min_int", _eui_to_int(self.min_eui))
+        object.__setattr__(self, "max_int", _eui_to_int(self.max_eui))
 
     def contains(self, eui: str) -> bool:
         """Check if an EUI falls within this range.
@@ -156,10 +179,10 @@ class EUIRange:
         """
         if len(range_spec) != 2:
             raise ValueError("EUI range must have exactly 2 elements [min, max]")
-        return cls(min_eui=range_spec[0], max_eui=range_spec[1])
+        return _cached_eui_range(range_spec[0], range_spec[1])
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EUIMask:
     """Represents an EUI mask pattern for filtering.
 
@@ -170,17 +193,20 @@ class EUIMask:
         pattern: The original mask pattern.
         mask_int: The integer mask (bits set where pattern is specific).
         pattern_int: The pattern value with wildcards as 0.
+        target_int: Precomputed pattern_int & mask_int for match checks.
     """
 
     pattern: str
     mask_int: int = field(init=False)
     pattern_int: int = field(init=False)
+    target_int: int = field(init=False)
 
     def __post_init__(self) -> None:
         """Calculate mask values after initialization."""
         pattern_str, mask_str = _parse_eui_mask(self.pattern)
-        self.pattern_int = _eui_to_int(pattern_str)
-        self.mask_int = _eui_to_int(mask_str)
+        object.__setattr__(self, "pattern_int", _eui_to_int(pattern_str))
+        object.__setattr__(self, "mask_int", _eui_to_int(mask_str))
+        object.__setattr__(self, "target_int", self.pattern_int & self.mask_int)
 
     def matches(self, eui: str) -> bool:
         """Check if an EUI matches this mask pattern.
@@ -192,7 +218,7 @@ class EUIMask:
             True if the EUI matches the mask pattern, False otherwise.
         """
         eui_int = _eui_to_int(_normalize_eui(eui))
-        return (eui_int & self.mask_int) == (self.pattern_int & self.mask_int)
+        return (eui_int & self.mask_int) == self.target_int
 
     @classmethod
     def from_string(cls, mask_spec: str) -> EUIMask:
@@ -204,7 +230,40 @@ class EUIMask:
         Returns:
             An EUIMask instance.
         """
-        return cls(pattern=mask_spec)
+        return _cached_eui_mask(mask_spec)
+
+
+@lru_cache(maxsize=256)
+def _cached_eui_range(min_eui: str, max_eui: str) -> EUIRange:
+    """Build (or reuse) an EUIRange for the given bounds.
+
+    EUIRange is frozen, so identical specs across config reloads and
+    filters share one compiled instance.
+
+    Args:
+        min_eui: The minimum EUI in the range (inclusive).
+        max_eui: The maximum EUI in the range (inclusive).
+
+    Returns:
+        An EUIRange instance.
+    """
+    return EUIRange(min_eui=min_eui, max_eui=max_eui)
+
+
+@lru_cache(maxsize=256)
+def _cached_eui_mask(mask_spec: str) -> EUIMask:
+    """Build (or reuse) an EUIMask for the given pattern.
+
+    EUIMask is frozen, so identical patterns across config reloads and
+    filters share one compiled instance.
+
+    Args:
+        mask_spec: The mask pattern (e.g., "00-11-22-xx-xx-xx-xx-xx").
+
+    Returns:
+        An EUIMask instance.
+    """
+    return EUIMask(pattern=mask_spec)
 
 
 def _parse_topic_format(value: Any) -> list[TopicFormat]:
@@ -235,7 +294,7 @@ def _parse_topic_format(value: Any) -> list[TopicFormat]:
     return [TopicFormat.LORA]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TopicConfig:
     """Configuration for MQTT topic formats.
 
@@ -248,6 +307,18 @@ class TopicConfig:
     format: TopicFormat = TopicFormat.LORA
     uplink_pattern: str = "lora/+/+/up"
     downlink_pattern: str = "lora/%s/down"
+    _resolved_uplink: str = field(init=False, repr=False, compare=False)
+    _resolved_downlink: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Resolve the format-dependent patterns once."""
+        # Enum members are singletons, so identity beats str.__eq__ here
+        if self.format is TopicFormat.SCADA:
+            object.__setattr__(self, "_resolved_uplink", "scada/+/up")
+            object.__setattr__(self, "_resolved_downlink", "scada/%s/down")
+        else:
+            object.__setattr__(self, "_resolved_uplink", self.uplink_pattern)
+            object.__setattr__(self, "_resolved_downlink", self.downlink_pattern)
 
     def get_uplink_pattern(self) -> str:
         """Get the uplink topic pattern based on format.
@@ -255,9 +326,7 @@ class TopicConfig:
         Returns:
             The uplink topic pattern string.
         """
-        if self.format == TopicFormat.SCADA:
-            return "scada/+/up"
-        return self.uplink_pattern
+        return self._resolved_uplink
 
     def get_downlink_pattern(self) -> str:
         """Get the downlink topic pattern based on format.
@@ -265,9 +334,7 @@ class TopicConfig:
         Returns:
             The downlink topic pattern string.
         """
-        if self.format == TopicFormat.SCADA:
-            return "scada/%s/down"
-        return self.downlink_pattern
+        return self._resolved_downlink
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> TopicConfig:
@@ -289,7 +356,7 @@ class TopicConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class LocalBrokerConfig:
     """Configuration for the local MQTT broker connection.
 
@@ -362,7 +429,7 @@ def _parse_eui_masks(masks_data: list[str]) -> list[EUIMask]:
     return [EUIMask.from_string(mask) for mask in masks_data]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MessageFilterConfig:
     """Configuration for filtering messages by device identifiers.
 
@@ -425,7 +492,7 @@ class MessageFilterConfig:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FieldFilterConfig:
     """Configuration for filtering fields in uplink messages.
 
@@ -433,11 +500,23 @@ class FieldFilterConfig:
         include_fields: List of field names to include (empty = include all).
         exclude_fields: List of field names to exclude.
         always_include: Fields that are always included regardless of filters.
+        include_set: Frozenset of include_fields for O(1) membership tests.
+        exclude_set: Frozenset of exclude_fields for O(1) membership tests.
+        always_set: Frozenset of always_include for O(1) membership tests.
     """
 
     include_fields: list[str] = field(default_factory=list)
     exclude_fields: list[str] = field(default_factory=list)
-    always_include: list[str] = field(default_factory=lambda: ["deveui", "appeui", "time"])
+    always_include: Sequence[str] = field(default=_DEFAULT_ALWAYS_INCLUDE)
+    include_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    exclude_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    always_set: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute frozensets for per-message membership tests."""
+        object.__setattr__(self, "include_set", frozenset(self.include_fields))
+        object.__setattr__(self, "exclude_set", frozenset(self.exclude_fields))
+        object.__setattr__(self, "always_set", frozenset(self.always_include))
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> FieldFilterConfig:
@@ -452,11 +531,11 @@ class FieldFilterConfig:
         return cls(
             include_fields=data.get("include_fields", []),
             exclude_fields=data.get("exclude_fields", []),
-            always_include=data.get("always_include", ["deveui", "appeui", "time"]),
+            always_include=data.get("always_include", _DEFAULT_ALWAYS_INCLUDE),
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TLSConfig:
     """Configuration for TLS/SSL connections.
 
@@ -496,7 +575,7 @@ class TLSConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RemoteBrokerConfig:
     """Configuration for a remote MQTT broker connection.
 
@@ -517,6 +596,7 @@ class RemoteBrokerConfig:
         clean_session: Whether to use a clean session.
         qos: Default QoS level for publishes.
         retain: Whether to retain published messages.
+        format_mask: Bitmask of source_topic_format for O(1) membership tests.
     """
 
     name: str = ""
@@ -527,7 +607,7 @@ class RemoteBrokerConfig:
     password: str | None = None
     client_id: str | None = None
     tls: TLSConfig = field(default_factory=TLSConfig)
-    source_topic_format: list[TopicFormat] = field(default_factory=lambda: [TopicFormat.LORA])
+    source_topic_format: Sequence[TopicFormat] = field(default=_DEFAULT_SOURCE_FORMAT)
     topics: TopicConfig = field(default_factory=TopicConfig)
     message_filter: MessageFilterConfig = field(default_factory=MessageFilterConfig)
     field_filter: FieldFilterConfig = field(default_factory=FieldFilterConfig)
@@ -535,6 +615,25 @@ class RemoteBrokerConfig:
     clean_session: bool = False
     qos: int = 1
     retain: bool = True
+    format_mask: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compile the source topic format list into a bitmask."""
+        mask = 0
+        for fmt in self.source_topic_format:
+            mask |= _TOPIC_FORMAT_BITS[fmt]
+        self.format_mask = mask
+
+    def accepts_format(self, fmt: TopicFormat) -> bool:
+        """Check whether this broker receives the given source topic format.
+
+        Args:
+            fmt: The topic format to test.
+
+        Returns:
+            True if fmt is in source_topic_format.
+        """
+        return bool(self.format_mask & _TOPIC_FORMAT_BITS[fmt])
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> RemoteBrokerConfig:
@@ -546,11 +645,6 @@ class RemoteBrokerConfig:
         Returns:
             A RemoteBrokerConfig instance.
         """
-        tls_data = data.get("tls", {})
-        topics_data = data.get("topics", {})
-        message_filter_data = data.get("message_filter", {})
-        field_filter_data = data.get("field_filter", {})
-
         return cls(
             name=data.get("name", ""),
             enabled=data.get("enabled", True),
@@ -559,17 +653,17 @@ class RemoteBrokerConfig:
             username=data.get("username"),
             password=data.get("password"),
             client_id=data.get("client_id"),
-            tls=TLSConfig.from_dict(tls_data) if tls_data else TLSConfig(),
+            tls=TLSConfig.from_dict(data["tls"]) if data.get("tls") else TLSConfig(),
             source_topic_format=_parse_topic_format(data.get("source_topic_format")),
-            topics=TopicConfig.from_dict(topics_data) if topics_data else TopicConfig(),
+            topics=TopicConfig.from_dict(data["topics"]) if data.get("topics") else TopicConfig(),
             message_filter=(
-                MessageFilterConfig.from_dict(message_filter_data)
-                if message_filter_data
+                MessageFilterConfig.from_dict(data["message_filter"])
+                if data.get("message_filter")
                 else MessageFilterConfig()
             ),
             field_filter=(
-                FieldFilterConfig.from_dict(field_filter_data)
-                if field_filter_data
+                FieldFilterConfig.from_dict(data["field_filter"])
+                if data.get("field_filter")
                 else FieldFilterConfig()
             ),
             keepalive=data.get("keepalive", 60),
@@ -579,7 +673,7 @@ class RemoteBrokerConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class LogConfig:
     """Configuration for logging.
 
@@ -610,7 +704,7 @@ class LogConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BridgeConfig:
     """Main configuration for the MQTT Bridge application.
 
@@ -620,6 +714,7 @@ class BridgeConfig:
         log: Logging configuration.
         reconnect_delay: Delay in seconds before reconnecting.
         max_reconnect_delay: Maximum reconnect delay in seconds.
+        fanout_workers: Number of threads for remote fan-out (1 = inline).
     """
 
     local_broker: LocalBrokerConfig = field(default_factory=LocalBrokerConfig)
@@ -627,6 +722,7 @@ class BridgeConfig:
     log: LogConfig = field(default_factory=LogConfig)
     reconnect_delay: float = 1.0
     max_reconnect_delay: float = 60.0
+    fanout_workers: int = 1
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> BridgeConfig:
@@ -654,4 +750,5 @@ class BridgeConfig:
             log=LogConfig.from_dict(log_data) if log_data else LogConfig(),
             reconnect_delay=data.get("reconnect_delay", 1.0),
             max_reconnect_delay=data.get("max_reconnect_delay", 60.0),
+            fanout_workers=data.get("fanout_workers", 1),
         )
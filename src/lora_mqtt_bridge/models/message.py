@@ -8,9 +8,13 @@ Compatible with Python 3.10+ and mLinux 7.1.0
 
 from __future__ import annotations
 
+import re
+from collections.abc import Collection, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 
@@ -24,6 +28,61 @@ class MessageType(str, Enum):
     CLEAR = "clear"
 
 
+# Canonical form: 8 lowercase hex byte pairs joined by dashes
+_CANONICAL_EUI_RE = re.compile(r"[0-9a-f]{2}(?:-[0-9a-f]{2}){7}")
+
+# Strips EUI separators and lowercases hex digits in one C-level pass
+_EUI_NORM_TBL = str.maketrans("ABCDEF", "abcdef", ":-")
+
+# Fields never forwarded to remote brokers
+_INTERNAL_FIELDS = frozenset({"raw_data", "message_type", "topic"})
+
+# Default always-include set, shared across calls
+_DEFAULT_ALWAYS_INCLUDE = frozenset({"deveui", "appeui", "time"})
+
+
+@lru_cache(maxsize=8192)
+def _normalize_eui_cached(eui: str) -> str:
+    """Normalize an EUI string to lowercase with dashes.
+
+    Cached because a small device fleet repeats the same EUIs on every
+    message, turning steady-state normalization into a dict lookup.
+
+    Args:
+        eui: The EUI string to normalize.
+
+    Returns:
+        The normalized EUI string.
+    """
+    # Fast path: already canonical, no string rebuilding needed
+    if _CANONICAL_EUI_RE.fullmatch(eui):
+        return eui
+    # Remove colons and convert to lowercase with dashes
+    clean = eui.translate(_EUI_NORM_TBL)
+    if len(clean) == 16:
+        try:
+            # Single C call that emits the dashed byte-pair form
+            return bytes.fromhex(clean).hex("-")
+        except ValueError:
+            # Non-hex 16-char value: keep the historical dashed form
+            return "-".join([clean[i : i + 2] for i in range(0, 16, 2)])
+    return eui.lower()
+
+
+def _eui_int_or_sentinel(eui: str | None) -> int:
+    """Parse a canonical EUI to its 64-bit integer form.
+
+    Args:
+        eui: A normalized EUI string, or None.
+
+    Returns:
+        The integer EUI, or -1 if the value is not a canonical EUI.
+    """
+    if eui is not None and _CANONICAL_EUI_RE.fullmatch(eui):
+        return int.from_bytes(bytes.fromhex(eui.replace("-", "")), "big")
+    return -1
+
+
 def _normalize_eui(eui: str | int | None) -> str | None:
     """Normalize EUI values to lowercase with dashes.
 
@@ -38,14 +97,10 @@ def _normalize_eui(eui: str | int | None) -> str | None:
     # Convert to string if not already
     if not isinstance(eui, str):
         eui = str(eui)
-    # Remove colons and convert to lowercase with dashes
-    clean = eui.replace(":", "").replace("-", "").lower()
-    if len(clean) == 16:
-        return "-".join([clean[i : i + 2] for i in range(0, 16, 2)])
-    return eui.lower()
+    return _normalize_eui_cached(eui)
 
 
-@dataclass
+@dataclass(slots=True)
 class LoRaMessage:
     """Model representing a LoRaWAN message.
 
@@ -60,6 +115,9 @@ class LoRaMessage:
         raw_data: The raw message data dictionary.
         message_type: The type of message.
         topic: The original MQTT topic.
+        deveui_int: Integer form of deveui, or -1 if not a valid EUI.
+        appeui_int: Integer form of appeui, or -1 if not a valid EUI.
+        joineui_int: Integer form of the effective JoinEUI, or -1.
     """
 
     deveui: str = ""
@@ -69,16 +127,38 @@ class LoRaMessage:
     time: datetime | str | None = None
     port: int | None = None
     data: str | None = None
-    raw_data: dict[str, Any] = field(default_factory=dict)
+    raw_data: Mapping[str, Any] = field(default_factory=dict)
     message_type: MessageType = MessageType.UPLINK
     topic: str | None = None
+    deveui_int: int = field(init=False, repr=False, compare=False)
+    appeui_int: int = field(init=False, repr=False, compare=False)
+    joineui_int: int = field(init=False, repr=False, compare=False)
+    _dict_cache: dict[str, Any] | None = field(init=False, repr=False, compare=False, default=None)
 
     def __post_init__(self) -> None:
         """Normalize EUI values after initialization."""
         self.deveui = _normalize_eui(self.deveui) or ""
-        self.appeui = _normalize_eui(self.appeui)
-        self.joineui = _normalize_eui(self.joineui)
-        self.gweui = _normalize_eui(self.gweui)
+        appeui_raw = self.appeui
+        if appeui_raw is not None:
+            self.appeui = _normalize_eui(appeui_raw)
+        if self.joineui is not None:
+            # joineui commonly aliases appeui; reuse the normalized result
+            if self.joineui is appeui_raw:
+                self.joineui = self.appeui
+            else:
+                self.joineui = _normalize_eui(self.joineui)
+        if self.gweui is not None:
+            self.gweui = _normalize_eui(self.gweui)
+        # Read-only view: mutating raw_data would desync the derived fields
+        if type(self.raw_data) is dict:
+            self.raw_data = MappingProxyType(self.raw_data)
+        # Parse the EUIs to ints once; filters compare integers
+        self.deveui_int = _eui_int_or_sentinel(self.deveui)
+        self.appeui_int = _eui_int_or_sentinel(self.appeui)
+        if self.joineui is None or self.joineui == self.appeui:
+            self.joineui_int = self.appeui_int
+        else:
+            self.joineui_int = _eui_int_or_sentinel(self.joineui)
 
     @classmethod
     def from_mqtt_payload(
@@ -110,10 +190,11 @@ class LoRaMessage:
         if isinstance(deveui, str) and not deveui.strip():
             raise ValueError("deveui cannot be empty")
 
+        appeui = payload.get("appeui")
         return cls(
-            deveui=payload.get("deveui", ""),
-            appeui=payload.get("appeui"),
-            joineui=payload.get("joineui") or payload.get("appeui"),
+            deveui=deveui,
+            appeui=appeui,
+            joineui=payload.get("joineui") or appeui,
             gweui=payload.get("gweui"),
             time=payload.get("time"),
             port=payload.get("port"),
@@ -133,12 +214,17 @@ class LoRaMessage:
 
     def to_filtered_dict(
         self,
-        include_fields: list[str] | None = None,
-        exclude_fields: list[str] | None = None,
-        always_include: list[str] | None = None,
+        include_fields: Collection[str] | None = None,
+        exclude_fields: Collection[str] | None = None,
+        always_include: Collection[str] | None = None,
     ) -> dict[str, Any]:
         """Convert message to a filtered dictionary.
 
+        Callers with precomputed frozensets (e.g. FieldFilterConfig's
+        include_set/exclude_set/always_set) can pass them directly;
+        frozenset(x) is an identity operation for frozensets, so no
+        per-call set construction happens.
+
         Args:
             include_fields: Fields to include (empty/None = all).
             exclude_fields: Fields to exclude.
@@ -147,28 +233,41 @@ class LoRaMessage:
         Returns:
             A filtered dictionary representation of the message.
         """
-        always_include = always_include or ["deveui", "appeui", "time"]
-        exclude_fields = exclude_fields or []
+        if self.raw_data:
+            source = self.raw_data
+        else:
+            # Memoized: several remote brokers filter the same message
+            if self._dict_cache is None:
+                self._dict_cache = self._to_dict()
+            source = self._dict_cache
+
+        # Fast path: no filters configured, just drop the internal keys
+        if not include_fields and not exclude_fields:
+            return {k: v for k, v in source.items() if k not in _INTERNAL_FIELDS}
+
+        # Frozensets make the per-key membership tests O(1)
+        always_set = frozenset(always_include) if always_include else _DEFAULT_ALWAYS_INCLUDE
+        exclude_set = frozenset(exclude_fields) if exclude_fields else frozenset()
+        include_set = frozenset(include_fields) if include_fields else None
 
         result: dict[str, Any] = {}
-        source = self.raw_data if self.raw_data else self._to_dict()
 
         for key, value in source.items():
             # Skip internal fields
-            if key in ("raw_data", "message_type", "topic"):
+            if key in _INTERNAL_FIELDS:
                 continue
 
             # Always include required fields
-            if key in always_include:
+            if key in always_set:
                 result[key] = value
                 continue
 
             # Check exclude list
-            if key in exclude_fields:
+            if key in exclude_set:
                 continue
 
             # Check include list (if specified)
-            if include_fields and key not in include_fields:
+            if include_set is not None and key not in include_set:
                 continue
 
             result[key] = value
@@ -199,7 +298,7 @@ class LoRaMessage:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class DownlinkMessage:
     """Model representing a LoRaWAN downlink message.
 
@@ -9,6 +9,7 @@ from __future__ import annotations
 import json
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -26,6 +27,57 @@ from lora_mqtt_bridge.models.config import (
 logger = logging.getLogger(__name__)
 
 
+def load_config_from_bytes(data: bytes | str) -> BridgeConfig:
+    """Parse configuration from an in-memory JSON buffer.
+
+    The pure-CPU core of load_config, usable directly when the JSON is
+    already in memory (tests, embedded config blobs) without staging it
+    to disk first.
+
+    Args:
+        data: JSON document as bytes or str.
+
+    Returns:
+        A BridgeConfig instance.
+
+    Raises:
+        ValueError: If the JSON or configuration is invalid.
+    """
+    try:
+        return BridgeConfig.from_dict(json.loads(data))
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in config file: {e}") from e
+    except Exception as e:
+        raise ValueError(f"Failed to load config: {e}") from e
+
+
+@lru_cache(maxsize=32)
+def _load_config_dict_cached(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Read and parse a config file's JSON, cached on (path, mtime).
+
+    A changed file gets a new mtime and therefore a fresh parse; repeated
+    loads of an unchanged file (common in tests and reload checks) skip
+    the file read and JSON parse. Only the parsed dict is cached, not the
+    built BridgeConfig: callers mutate their config (e.g. CLI log-level
+    overrides in main), so each load must return a fresh instance.
+
+    Args:
+        path: Path to the configuration file.
+        mtime_ns: The file's st_mtime_ns at lookup time.
+
+    Returns:
+        The parsed configuration dictionary.
+
+    Raises:
+        ValueError: If the file is not valid JSON.
+    """
+    try:
+        data: dict[str, Any] = json.loads(Path(path).read_bytes())
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in config file: {e}") from e
+    return data
+
+
 def load_config(config_path: str | Path) -> BridgeConfig:
     """Load configuration from a JSON file.
 
@@ -43,17 +95,16 @@ def load_config(config_path: str | Path) -> BridgeConfig:
     if not path.exists():
         raise FileNotFoundError(f"Configuration file not found: {path}")
 
+    data = _load_config_dict_cached(str(path), path.stat().st_mtime_ns)
     try:
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
-
         return BridgeConfig.from_dict(data)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON in config file: {e}") from e
     except Exception as e:
         raise ValueError(f"Failed to load config: {e}") from e
 
 
+_ENV_PREFIX = "LORA_MQTT_BRIDGE_"
+
+
 def load_config_from_env() -> BridgeConfig:
     """Load configuration from environment variables.
 
@@ -62,17 +113,23 @@ def load_config_from_env() -> BridgeConfig:
     Returns:
         A BridgeConfig instance.
     """
-    prefix = "LORA_MQTT_BRIDGE_"
+    return BridgeConfig(
+        local_broker=load_local_broker_from_env(),
+        remote_brokers=load_remote_brokers_from_env(),
+    )
+
+
+def load_local_broker_from_env() -> LocalBrokerConfig:
+    """Build only the local broker configuration from the environment.
+
+    Returns:
+        A LocalBrokerConfig instance.
+    """
+    prefix = _ENV_PREFIX
 
     def get_env(key: str, default: str | None = None) -> str | None:
         return os.environ.get(f"{prefix}{key}", default)
 
-    def get_env_bool(key: str, default: bool = False) -> bool:
-        value = get_env(key)
-        if value is None:
-            return default
-        return value.lower() in ("true", "1", "yes")
-
     def get_env_int(key: str, default: int) -> int:
         value = get_env(key)
         if value is None:
@@ -82,12 +139,6 @@ def load_config_from_env() -> BridgeConfig:
         except ValueError:
             return default
 
-    def get_env_list(key: str) -> list[str]:
-        value = get_env(key)
-        if value is None or value.strip() == "":
-            return []
-        return [v.strip() for v in value.split(",")]
-
     # Build local broker config
     topic_format = get_env("LOCAL_TOPIC_FORMAT", "lora")
     local_topics = TopicConfig(
@@ -96,7 +147,7 @@ def load_config_from_env() -> BridgeConfig:
         downlink_pattern=get_env("LOCAL_DOWNLINK_PATTERN", "lora/%s/down") or "lora/%s/down",
     )
 
-    local_broker = LocalBrokerConfig(
+    return LocalBrokerConfig(
         host=get_env("LOCAL_HOST", "127.0.0.1") or "127.0.0.1",
         port=get_env_int("LOCAL_PORT", 1883),
         username=get_env("LOCAL_USERNAME"),
@@ -106,6 +157,39 @@ def load_config_from_env() -> BridgeConfig:
         keepalive=get_env_int("LOCAL_KEEPALIVE", 60),
     )
 
+
+def load_remote_brokers_from_env() -> list[RemoteBrokerConfig]:
+    """Build only the remote broker configurations from the environment.
+
+    Returns:
+        A list of RemoteBrokerConfig instances (possibly empty).
+    """
+    prefix = _ENV_PREFIX
+
+    def get_env(key: str, default: str | None = None) -> str | None:
+        return os.environ.get(f"{prefix}{key}", default)
+
+    def get_env_bool(key: str, default: bool = False) -> bool:
+        value = get_env(key)
+        if value is None:
+            return default
+        return value.lower() in ("true", "1", "yes")
+
+    def get_env_int(key: str, default: int) -> int:
+        value = get_env(key)
+        if value is None:
+            return default
+        try:
+            return int(value)
+        except ValueError:
+            return default
+
+    def get_env_list(key: str) -> list[str]:
+        value = get_env(key)
+        if value is None or value.strip() == "":
+            return []
+        return [v.strip() for v in value.split(",")]
+
     # Build remote broker configs from JSON env var
     remote_brokers: list[RemoteBrokerConfig] = []
     remote_config_json = get_env("REMOTE_BROKERS")
@@ -172,10 +256,7 @@ def load_config_from_env() -> BridgeConfig:
             )
         )
 
-    return BridgeConfig(
-        local_broker=local_broker,
-        remote_brokers=remote_brokers,
-    )
+    return remote_brokers
 
 
 def _parse_remote_broker(data: dict[str, Any]) -> RemoteBrokerConfig:
@@ -6,8 +6,10 @@ for the LoRa MQTT Bridge application.
 
 from __future__ import annotations
 
+import atexit
 import logging
 import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -16,6 +18,18 @@ if TYPE_CHECKING:
     from lora_mqtt_bridge.models.config import LogConfig
 
 
+# Listener thread that drains log records queued by the hot path
+_queue_listener: logging.handlers.QueueListener | None = None
+
+
+def _stop_queue_listener() -> None:
+    """Stop the queue listener thread if one is running."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
 def setup_logging(config: LogConfig | None = None) -> logging.Logger:
     """Set up logging for the application.
 
@@ -25,6 +39,8 @@ def setup_logging(config: LogConfig | None = None) -> logging.Logger:
     Returns:
         The configured root logger.
     """
+    global _queue_listener
+
     # Default configuration
     level_str = "INFO"
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -42,17 +58,21 @@ def setup_logging(config: LogConfig | None = None) -> logging.Logger:
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
 
-    # Clear existing handlers
+    # Clear existing handlers and stop any previous listener thread
     root_logger.handlers.clear()
+    _stop_queue_listener()
 
     # Create formatter
     formatter = logging.Formatter(log_format, datefmt="%Y-%m-%dT%H:%M:%S%z")
 
+    # Real output handlers, drained by the listener thread below
+    handlers: list[logging.Handler] = []
+
     # Add console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
 
     # Add file handler if configured
     if log_file:
@@ -66,7 +86,7 @@ def setup_logging(config: LogConfig | None = None) -> logging.Logger:
         )
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
 
     # Try to add syslog handler on Linux
     try:
@@ -74,11 +94,23 @@ def setup_logging(config: LogConfig | None = None) -> logging.Logger:
         syslog_handler.ident = "lora-mqtt-bridge: "
         syslog_handler.setLevel(level)
         syslog_handler.setFormatter(formatter)
-        root_logger.addHandler(syslog_handler)
+        handlers.append(syslog_handler)
     except (FileNotFoundError, OSError):
         # Syslog not available on this system
         pass
 
+    # Route all records through a queue so the message threads only enqueue;
+    # formatting and handler I/O happen on the listener thread.
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue,
+        *handlers,
+        respect_handler_level=True,
+    )
+    _queue_listener.start()
+    atexit.register(_stop_queue_listener)
+
     # Set levels for noisy libraries
     logging.getLogger("paho.mqtt").setLevel(logging.WARNING)
 
@@ -9,16 +9,24 @@ Compatible with Python 3.10+ and mLinux 7.1.0
 
 from __future__ import annotations
 
+import itertools
 import json
 import logging
 import os
 import threading
 import time
+from collections import deque
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
 
+# Static status-string fragments, shared across ticks
+_LOCAL_OK = "Local:OK"
+_LOCAL_DISC = "Local:DISC"
+_REMOTE_NONE = "Remote:none"
+
+
 class StatusWriter:
     """Write application status to status.json for mPower integration.
 
@@ -58,9 +66,16 @@ class StatusWriter:
         # Connection status tracking
         self._local_connected = False
         self._remote_connections: dict[str, bool] = {}
+        self._remote_connected_count = 0
         self._message_count = 0
-        self._last_message_time: str | None = None
-        self._errors: list[str] = []
+        self._msg_counter = itertools.count(1)
+        self._last_message_time: float | None = None
+        # Bounded: the oldest error falls off automatically
+        self._errors: deque[str] = deque(maxlen=5)
+
+        # Last periodic status content (timestamp excluded), to skip
+        # rewriting identical content
+        self._last_status: str | None = None
 
     def start(self) -> None:
         """Start the background status update thread."""
@@ -102,8 +117,8 @@ class StatusWriter:
         Args:
             connected: Whether the local broker is connected.
         """
-        with self._lock:
-            self._local_connected = connected
+        # Single attribute store; atomic under the GIL, no lock needed
+        self._local_connected = connected
 
     def set_remote_connected(self, name: str, connected: bool) -> None:
         """Set a remote broker connection status.
@@ -112,14 +127,21 @@ class StatusWriter:
             name: The remote broker name.
             connected: Whether the broker is connected.
         """
+        # Connection changes are rare, so a lock here is fine; it keeps
+        # the incremental connected-count consistent with the dict.
         with self._lock:
+            prev = self._remote_connections.get(name, False)
+            if prev != connected:
+                self._remote_connected_count += 1 if connected else -1
             self._remote_connections[name] = connected
 
     def increment_message_count(self) -> None:
         """Increment the forwarded message count."""
-        with self._lock:
-            self._message_count += 1
-            self._last_message_time = time.strftime("%Y-%m-%d %H:%M:%S")
+        # itertools.count.__next__ runs in C and is atomic under the GIL,
+        # so the per-message path takes no lock; the timestamp is stored
+        # as a raw float and formatted lazily if ever displayed.
+        self._message_count = next(self._msg_counter)
+        self._last_message_time = time.time()
 
     def add_error(self, error: str) -> None:
         """Add an error to the error list.
@@ -128,10 +150,8 @@ class StatusWriter:
             error: Error message to add.
         """
         with self._lock:
-            # Keep only last 5 errors
+            # deque(maxlen=5) drops the oldest entry in O(1)
             self._errors.append(error)
-            if len(self._errors) > 5:
-                self._errors.pop(0)
 
     def clear_errors(self) -> None:
         """Clear all errors."""
@@ -146,15 +166,15 @@ class StatusWriter:
         """
         with self._lock:
             # Build connection status
-            local_status = "Local:OK" if self._local_connected else "Local:DISC"
+            local_status = _LOCAL_OK if self._local_connected else _LOCAL_DISC
 
             remote_count = len(self._remote_connections)
-            remote_connected = sum(1 for c in self._remote_connections.values() if c)
+            remote_connected = self._remote_connected_count
 
             if remote_count > 0:
                 remote_status = f"Remote:{remote_connected}/{remote_count}"
             else:
-                remote_status = "Remote:none"
+                remote_status = _REMOTE_NONE
 
             # Build message
             parts = [local_status, remote_status]
@@ -165,13 +185,9 @@ class StatusWriter:
             if self._errors:
                 parts.append(f"Errs:{len(self._errors)}")
 
-            status = " | ".join(parts)
-
-            # Add timestamp
-            timestamp = time.strftime("%H:%M:%S")
-            status = f"{status} @ {timestamp}"
-
-            return status[:160]  # Truncate to 160 chars
+            # Timestamp deliberately excluded: it is appended at write
+            # time so identical content compares equal across ticks
+            return " | ".join(parts)
 
     def _write_status(self, app_info: str | None = None) -> None:
         """Write the status.json file.
@@ -180,21 +196,41 @@ class StatusWriter:
             app_info: Optional override for app info message.
         """
         try:
-            pid = os.getpid()
-            info = app_info if app_info is not None else self._build_status_message()
+            status: str | None = None
+            if app_info is not None:
+                info = app_info
+            else:
+                status = self._build_status_message()
+                # Unchanged content: skip the write entirely to spare
+                # gateway flash. The timestamp is only refreshed when the
+                # status fields change, so idle ticks perform no write.
+                if status == self._last_status:
+                    return
+                timestamp = time.strftime("%H:%M:%S")
+                info = f"{status} @ {timestamp}"[:160]
 
             status_data = {
-                "pid": pid,
+                "pid": os.getpid(),
                 "AppInfo": info,
             }
 
+            # Serialize to one bytes buffer and write it with a single
+            # syscall; no TextIOWrapper buffering in between
+            buf = json.dumps(status_data).encode("utf-8")
+
             # Write atomically by writing to temp file first
             temp_file = self.status_file + ".tmp"
-            with open(temp_file, "w") as f:
-                json.dump(status_data, f)
+            fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, buf)
+            finally:
+                os.close(fd)
 
             # Rename to final location
             os.replace(temp_file, self.status_file)
+            # Explicit writes (stop, write_immediate) record None so the
+            # next periodic tick always rewrites the file
+            self._last_status = status
 
             logger.debug("Status updated: %s", info)
 
@@ -203,9 +239,12 @@ class StatusWriter:
 
     def _update_loop(self) -> None:
         """Background thread loop to update status periodically."""
+        # Tick on a monotonic deadline so write time doesn't drift the cadence
+        deadline = time.monotonic()
         while self._running:
             self._write_status()
-            self._stop_event.wait(timeout=self.update_interval)
+            deadline += self.update_interval
+            self._stop_event.wait(timeout=max(0.0, deadline - time.monotonic()))
 
     def write_immediate(self, message: str) -> None:
         """Write a status message immediately.
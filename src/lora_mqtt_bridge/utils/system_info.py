@@ -7,7 +7,8 @@ such as the gateway UUID.
 from __future__ import annotations
 
 import logging
-import subprocess
+import os
+import shutil
 from functools import lru_cache
 from pathlib import Path
 
@@ -19,6 +20,19 @@ UUID_PATHS = [
     "/sys/class/dmi/id/product_uuid",
 ]
 
+# The UUID is fixed per device, so it is cached across restarts to skip
+# the sysfs probe / mts-io-sysfs fork on subsequent startups
+_UUID_CACHE_PATH = Path("/var/cache/lora_mqtt_bridge/uuid")
+
+_DEFAULT_UUID = "00000000-0000-0000-0000-000000000000"
+
+# Lowercases hex digits and strips dashes in one C-level pass
+_UUID_TRANS = str.maketrans("ABCDEF", "abcdef", "-")
+
+# Resolved once; None on systems without the mLinux tooling, which lets
+# get_gateway_uuid skip the subprocess branch entirely
+_MTS_IO_SYSFS = shutil.which("mts-io-sysfs")
+
 
 def _format_uuid(uuid_raw: str) -> str:
     """Format a raw UUID string to standard format with dashes.
@@ -32,20 +46,47 @@ def _format_uuid(uuid_raw: str) -> str:
     Returns:
         Formatted UUID string with dashes.
     """
-    uuid_clean = uuid_raw.strip().lower().replace("-", "")
+    uuid_clean = uuid_raw.strip().translate(_UUID_TRANS)
     if len(uuid_clean) != 32:
         logger.warning("UUID has unexpected length: %d", len(uuid_clean))
         return uuid_raw.lower()
 
     # Format as 8-4-4-4-12
-    parts = [
-        uuid_clean[:8],
-        uuid_clean[8:12],
-        uuid_clean[12:16],
-        uuid_clean[16:20],
-        uuid_clean[20:],
-    ]
-    return "-".join(parts)
+    return (
+        f"{uuid_clean[:8]}-{uuid_clean[8:12]}-{uuid_clean[12:16]}"
+        f"-{uuid_clean[16:20]}-{uuid_clean[20:]}"
+    )
+
+
+def _read_cached_uuid() -> str | None:
+    """Read a previously resolved UUID from the on-disk cache.
+
+    Returns:
+        The cached UUID string, or None if the cache is absent or empty.
+    """
+    try:
+        uuid = _UUID_CACHE_PATH.read_text().strip()
+    except OSError:
+        return None
+    return uuid or None
+
+
+def _write_cached_uuid(uuid: str) -> None:
+    """Persist a resolved UUID to the on-disk cache.
+
+    Failures (read-only filesystem, missing permissions) are logged at
+    debug level and otherwise ignored; the cache is an optimization.
+
+    Args:
+        uuid: The formatted UUID string to cache.
+    """
+    try:
+        _UUID_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = _UUID_CACHE_PATH.with_suffix(".tmp")
+        temp_path.write_text(uuid)
+        os.replace(temp_path, _UUID_CACHE_PATH)
+    except OSError as e:
+        logger.debug("Failed to cache gateway UUID: %s", e)
 
 
 @lru_cache(maxsize=1)
@@ -53,42 +94,61 @@ def get_gateway_uuid() -> str:
     """Get the gateway UUID from the system.
 
     Tries multiple methods to retrieve the UUID:
-    1. Read from sysfs paths
-    2. Use mts-io-sysfs command
-    3. Fall back to a default value
+    1. Read from the on-disk cache left by a previous run
+    2. Read from sysfs paths
+    3. Use mts-io-sysfs command
+    4. Fall back to a default value
 
     Returns:
         The formatted gateway UUID string.
     """
-    # Try reading from sysfs paths
+    # A previous run already resolved the UUID; it never changes
+    cached = _read_cached_uuid()
+    if cached is not None:
+        logger.info("Got gateway UUID from cache: %s", cached)
+        return cached
+
+    # Try reading from sysfs paths; the open doubles as the existence
+    # check, and os.read skips the codec machinery for a 32-byte node
     for path_str in UUID_PATHS:
-        path = Path(path_str)
-        if path.exists():
+        try:
+            fd = os.open(path_str, os.O_RDONLY)
             try:
-                uuid_raw = path.read_text().strip()
-                if uuid_raw:
-                    formatted = _format_uuid(uuid_raw)
-                    logger.info("Got gateway UUID from %s: %s", path_str, formatted)
-                    return formatted
-            except OSError as e:
-                logger.debug("Failed to read UUID from %s: %s", path_str, e)
-
-    # Try mts-io-sysfs command
-    try:
-        result = subprocess.run(
-            ["mts-io-sysfs", "show", "uuid"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            uuid_raw = result.stdout.strip()
-            formatted = _format_uuid(uuid_raw)
-            logger.info("Got gateway UUID from mts-io-sysfs: %s", formatted)
-            return formatted
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError) as e:
-        logger.debug("Failed to get UUID from mts-io-sysfs: %s", e)
-
-    # Fall back to default
+                uuid_raw = os.read(fd, 64).decode("ascii").strip()
+            finally:
+                os.close(fd)
+            if uuid_raw:
+                formatted = _format_uuid(uuid_raw)
+                logger.info("Got gateway UUID from %s: %s", path_str, formatted)
+                _write_cached_uuid(formatted)
+                return formatted
+        except FileNotFoundError:
+            continue
+        except (OSError, UnicodeDecodeError) as e:
+            logger.debug("Failed to read UUID from %s: %s", path_str, e)
+
+    # Try mts-io-sysfs command; skipped outright when not installed.
+    # subprocess is imported lazily since this path only runs when the
+    # sysfs reads fail, and it is a comparatively heavy import.
+    if _MTS_IO_SYSFS is not None:
+        import subprocess
+
+        try:
+            result = subprocess.run(
+                [_MTS_IO_SYSFS, "show", "uuid"],
+                capture_output=True,
+                text=True,
+                timeout=5,
+            )
+            if result.returncode == 0 and result.stdout.strip():
+                uuid_raw = result.stdout.strip()
+                formatted = _format_uuid(uuid_raw)
+                logger.info("Got gateway UUID from mts-io-sysfs: %s", formatted)
+                _write_cached_uuid(formatted)
+                return formatted
+        except (subprocess.TimeoutExpired, FileNotFoundError, OSError) as e:
+            logger.debug("Failed to get UUID from mts-io-sysfs: %s", e)
+
+    # Fall back to default; deliberately not cached so later runs retry
     logger.warning("Could not determine gateway UUID, using default")
-    return "00000000-0000-0000-0000-000000000000"
+    return _DEFAULT_UUID
@@ -5,6 +5,7 @@ This module provides shared fixtures for testing the LoRa MQTT Bridge.
 
 from __future__ import annotations
 
+import copy
 from typing import TYPE_CHECKING, Any
 
 import pytest
@@ -25,7 +26,22 @@ if TYPE_CHECKING:
     pass
 
 
-@pytest.fixture
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Pin serial-marked tests to one xdist worker.
+
+    Tests marked ``serial`` mutate process-global state (os.environ),
+    so under pytest-xdist they all go to a single worker via a shared
+    xdist_group. Without xdist the extra marker is inert.
+
+    Args:
+        items: The collected test items.
+    """
+    for item in items:
+        if item.get_closest_marker("serial") is not None:
+            item.add_marker(pytest.mark.xdist_group("env"))
+
+
+@pytest.fixture(scope="session")
 def sample_uplink_payload() -> dict[str, Any]:
     """Create a sample uplink message payload.
 
@@ -47,7 +63,7 @@ def sample_uplink_payload() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_lora_message(sample_uplink_payload: dict[str, Any]) -> LoRaMessage:
     """Create a sample LoRaMessage instance.
 
@@ -64,7 +80,7 @@ def sample_lora_message(sample_uplink_payload: dict[str, Any]) -> LoRaMessage:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def local_broker_config() -> LocalBrokerConfig:
     """Create a local broker configuration for testing.
 
@@ -86,12 +102,12 @@ def local_broker_config() -> LocalBrokerConfig:
     )
 
 
-@pytest.fixture
-def remote_broker_config() -> RemoteBrokerConfig:
-    """Create a remote broker configuration for testing.
+@pytest.fixture(scope="session")
+def _remote_broker_config_base() -> RemoteBrokerConfig:
+    """Create the shared remote broker configuration template.
 
     Returns:
-        A RemoteBrokerConfig instance.
+        A RemoteBrokerConfig instance, built once per session.
     """
     return RemoteBrokerConfig(
         name="test-remote",
@@ -126,6 +142,22 @@ def remote_broker_config() -> RemoteBrokerConfig:
     )
 
 
+@pytest.fixture
+def remote_broker_config(_remote_broker_config_base: RemoteBrokerConfig) -> RemoteBrokerConfig:
+    """Create a per-test remote broker configuration.
+
+    A shallow copy of the session template, so tests that reassign
+    nested configs (e.g. message_filter) don't leak into each other.
+
+    Args:
+        _remote_broker_config_base: The session-scoped template fixture.
+
+    Returns:
+        A RemoteBrokerConfig instance.
+    """
+    return copy.copy(_remote_broker_config_base)
+
+
 @pytest.fixture
 def bridge_config(
     local_broker_config: LocalBrokerConfig,
@@ -146,7 +178,7 @@ def bridge_config(
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def message_filter_config_with_whitelist() -> MessageFilterConfig:
     """Create a message filter configuration with whitelists.
 
@@ -163,7 +195,7 @@ def message_filter_config_with_whitelist() -> MessageFilterConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def message_filter_config_with_blacklist() -> MessageFilterConfig:
     """Create a message filter configuration with blacklists.
 
@@ -180,7 +212,7 @@ def message_filter_config_with_blacklist() -> MessageFilterConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def field_filter_config() -> FieldFilterConfig:
     """Create a field filter configuration.
 
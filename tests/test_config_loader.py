@@ -8,254 +8,302 @@ from __future__ import annotations
 
 import json
 import os
-import tempfile
 from typing import TYPE_CHECKING
 
 import pytest
 
+from lora_mqtt_bridge.models.config import BridgeConfig
 from lora_mqtt_bridge.utils.config_loader import (
     load_config,
+    load_config_from_bytes,
     load_config_from_env,
 )
 
 if TYPE_CHECKING:
-    from _pytest.monkeypatch import MonkeyPatch
-
-
-class TestLoadConfig:
-    """Tests for load_config function."""
-
-    def test_load_valid_config_file(self) -> None:
-        """Test loading a valid configuration file."""
-        config_data = {
-            "local_broker": {
-                "host": "localhost",
-                "port": 1883,
-            },
-            "remote_brokers": [
-                {
-                    "name": "test",
-                    "host": "remote.example.com",
-                }
-            ],
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+# Minimal valid configuration, shared by the file-loading fixtures
+_VALID_CONFIG_DATA = {
+    "local_broker": {
+        "host": "localhost",
+        "port": 1883,
+    },
+    "remote_brokers": [
+        {
+            "name": "test",
+            "host": "remote.example.com",
         }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(config_data, f)
-            temp_path = f.name
-
-        try:
-            config = load_config(temp_path)
-            assert config.local_broker.host == "localhost"
-            assert len(config.remote_brokers) == 1
-            assert config.remote_brokers[0].name == "test"
-        finally:
-            os.unlink(temp_path)
-
-    def test_load_nonexistent_file(self) -> None:
-        """Test loading a file that doesn't exist."""
-        with pytest.raises(FileNotFoundError):
-            load_config("/nonexistent/path/config.json")
-
-    def test_load_invalid_json(self) -> None:
-        """Test loading a file with invalid JSON."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            f.write("not valid json")
-            temp_path = f.name
-
-        try:
-            with pytest.raises(ValueError, match="Invalid JSON"):
-                load_config(temp_path)
-        finally:
-            os.unlink(temp_path)
-
-    def test_load_config_with_all_options(self) -> None:
-        """Test loading a comprehensive configuration file."""
-        config_data = {
-            "local_broker": {
-                "host": "192.168.1.100",
-                "port": 1883,
-                "username": "localuser",
-                "password": "localpass",
-                "client_id": "custom-client",
-                "topics": {
-                    "format": "scada",
-                    "uplink_pattern": "scada/+/up",
-                    "downlink_pattern": "scada/%s/down",
-                },
-                "keepalive": 120,
+    ],
+}
+
+# Configuration exercising every option group
+_FULL_CONFIG_DATA = {
+    "local_broker": {
+        "host": "192.168.1.100",
+        "port": 1883,
+        "username": "localuser",
+        "password": "localpass",
+        "client_id": "custom-client",
+        "topics": {
+            "format": "scada",
+            "uplink_pattern": "scada/+/up",
+            "downlink_pattern": "scada/%s/down",
+        },
+        "keepalive": 120,
+    },
+    "remote_brokers": [
+        {
+            "name": "cloud",
+            "enabled": True,
+            "host": "cloud.example.com",
+            "port": 8883,
+            "username": "clouduser",
+            "password": "cloudpass",
+            "tls": {
+                "enabled": True,
+                "verify_hostname": True,
             },
-            "remote_brokers": [
-                {
-                    "name": "cloud",
-                    "enabled": True,
-                    "host": "cloud.example.com",
-                    "port": 8883,
-                    "username": "clouduser",
-                    "password": "cloudpass",
-                    "tls": {
-                        "enabled": True,
-                        "verify_hostname": True,
-                    },
-                    "message_filter": {
-                        "deveui_whitelist": ["00-11-22-33-44-55-66-77"],
-                    },
-                    "field_filter": {
-                        "exclude_fields": ["rssi", "snr"],
-                    },
-                }
-            ],
-            "log": {
-                "level": "DEBUG",
+            "message_filter": {
+                "deveui_whitelist": ["00-11-22-33-44-55-66-77"],
+            },
+            "field_filter": {
+                "exclude_fields": ["rssi", "snr"],
             },
         }
+    ],
+    "log": {
+        "level": "DEBUG",
+    },
+}
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(config_data, f)
-            temp_path = f.name
+# Reference configs built once at import; the file-loading tests compare
+# against these with a single dataclass __eq__ instead of walking
+# individual attributes
+_EXPECTED_VALID_CONFIG = BridgeConfig.from_dict(_VALID_CONFIG_DATA)
+_EXPECTED_FULL_CONFIG = BridgeConfig.from_dict(_FULL_CONFIG_DATA)
 
-        try:
-            config = load_config(temp_path)
 
-            assert config.local_broker.host == "192.168.1.100"
-            assert config.local_broker.username == "localuser"
-            assert config.local_broker.topics.format.value == "scada"
+@pytest.fixture(scope="session")
+def bridge_env_keys() -> frozenset[str]:
+    """Snapshot the pre-existing LORA_MQTT_BRIDGE_ env var names once.
 
-            assert len(config.remote_brokers) == 1
-            remote = config.remote_brokers[0]
-            assert remote.name == "cloud"
-            assert remote.tls.enabled is True
-            assert "00-11-22-33-44-55-66-77" in remote.message_filter.deveui_whitelist
-            assert "rssi" in remote.field_filter.exclude_fields
+    monkeypatch restores anything the tests themselves set, so only the
+    keys present at session start can leak into a scenario.
 
-            assert config.log.level == "DEBUG"
-        finally:
-            os.unlink(temp_path)
+    Returns:
+        The prefixed environment variable names at session start.
+    """
+    return frozenset(k for k in os.environ if k.startswith("LORA_MQTT_BRIDGE_"))
 
 
-class TestLoadConfigFromEnv:
-    """Tests for load_config_from_env function."""
+@pytest.fixture
+def clean_bridge_env(monkeypatch: pytest.MonkeyPatch, bridge_env_keys: frozenset[str]) -> None:
+    """Remove pre-existing LORA_MQTT_BRIDGE_ env vars for one test.
 
-    def test_default_values(self, monkeypatch: MonkeyPatch) -> None:
-        """Test that default values are used when env vars not set.
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+        bridge_env_keys: The session-start snapshot of prefixed keys.
+    """
+    for key in bridge_env_keys:
+        monkeypatch.delenv(key, raising=False)
 
-        Args:
-            monkeypatch: Pytest monkeypatch fixture.
-        """
-        # Clear any existing env vars
-        for key in list(os.environ.keys()):
-            if key.startswith("LORA_MQTT_BRIDGE_"):
-                monkeypatch.delenv(key, raising=False)
-
-        config = load_config_from_env()
 
-        assert config.local_broker.host == "127.0.0.1"
-        assert config.local_broker.port == 1883
+@pytest.fixture(scope="session")
+def valid_config_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the minimal valid config file once per session.
 
-    def test_local_broker_from_env(self, monkeypatch: MonkeyPatch) -> None:
-        """Test loading local broker config from environment.
+    Args:
+        tmp_path_factory: Pytest session-scoped temp directory factory.
 
-        Args:
-            monkeypatch: Pytest monkeypatch fixture.
-        """
-        monkeypatch.setenv("LORA_MQTT_BRIDGE_LOCAL_HOST", "192.168.1.50")
-        monkeypatch.setenv("LORA_MQTT_BRIDGE_LOCAL_PORT", "1884")
-        monkeypatch.setenv("LORA_MQTT_BRIDGE_LOCAL_USERNAME", "testuser")
-        monkeypatch.setenv("LORA_MQTT_BRIDGE_LOCAL_PASSWORD", "testpass")
+    Returns:
+        Path to the config file.
+    """
+    path = tmp_path_factory.mktemp("cfg") / "valid.json"
+    path.write_bytes(json.dumps(_VALID_CONFIG_DATA).encode("utf-8"))
+    return path
 
-        config = load_config_from_env()
 
-        assert config.local_broker.host == "192.168.1.50"
-        assert config.local_broker.port == 1884
-        assert config.local_broker.username == "testuser"
-        assert config.local_broker.password == "testpass"
+class TestLoadConfig:
+    """Tests for load_config function."""
 
-    def test_single_remote_broker_from_env(self, monkeypatch: MonkeyPatch) -> None:
-        """Test loading single remote broker from environment.
+    def test_load_valid_config_file(self, valid_config_path: Path) -> None:
+        """Test loading a valid configuration file.
 
         Args:
-            monkeypatch: Pytest monkeypatch fixture.
+            valid_config_path: Path to the minimal valid config file.
         """
-        monkeypatch.setenv("LORA_MQTT_BRIDGE_REMOTE_HOST", "remote.example.com")
-        monkeypatch.setenv("LORA_MQTT_BRIDGE_REMOTE_PORT", "8883")
-        monkeypatch.setenv("LORA_MQTT_BRIDGE_REMOTE_NAME", "cloud")
-        monkeypatch.setenv("LORA_MQTT_BRIDGE_REMOTE_TLS_ENABLED", "true")
-
-        config = load_config_from_env()
+        config = load_config(str(valid_config_path))
+        assert config == _EXPECTED_VALID_CONFIG
 
-        assert len(config.remote_brokers) == 1
-        remote = config.remote_brokers[0]
-        assert remote.host == "remote.example.com"
-        assert remote.port == 8883
-        assert remote.name == "cloud"
-        assert remote.tls.enabled is True
+    def test_load_nonexistent_file(self) -> None:
+        """Test loading a file that doesn't exist."""
+        with pytest.raises(FileNotFoundError):
+            load_config("/nonexistent/path/config.json")
 
-    def test_remote_brokers_json_from_env(self, monkeypatch: MonkeyPatch) -> None:
-        """Test loading multiple remote brokers from JSON env var.
+    def test_load_invalid_json(self, tmp_path: Path) -> None:
+        """Test loading a file with invalid JSON.
 
         Args:
-            monkeypatch: Pytest monkeypatch fixture.
+            tmp_path: Pytest per-test temp directory.
         """
-        brokers_json = json.dumps(
-            [
-                {"name": "broker1", "host": "broker1.example.com"},
-                {"name": "broker2", "host": "broker2.example.com", "port": 8884},
-            ]
-        )
-        monkeypatch.setenv("LORA_MQTT_BRIDGE_REMOTE_BROKERS", brokers_json)
-
-        config = load_config_from_env()
-
-        assert len(config.remote_brokers) == 2
-        assert config.remote_brokers[0].name == "broker1"
-        assert config.remote_brokers[1].name == "broker2"
-        assert config.remote_brokers[1].port == 8884
+        path = tmp_path / "invalid.json"
+        path.write_bytes(b"not valid json")
 
-    def test_topic_format_from_env(self, monkeypatch: MonkeyPatch) -> None:
-        """Test loading topic format from environment.
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            load_config(str(path))
 
-        Args:
-            monkeypatch: Pytest monkeypatch fixture.
-        """
-        monkeypatch.setenv("LORA_MQTT_BRIDGE_LOCAL_TOPIC_FORMAT", "scada")
-        monkeypatch.setenv("LORA_MQTT_BRIDGE_LOCAL_UPLINK_PATTERN", "scada/+/up")
-        monkeypatch.setenv("LORA_MQTT_BRIDGE_LOCAL_DOWNLINK_PATTERN", "scada/%s/down")
-
-        config = load_config_from_env()
+    def test_load_config_with_all_options(self) -> None:
+        """Test parsing a comprehensive configuration from memory."""
+        config = load_config_from_bytes(json.dumps(_FULL_CONFIG_DATA).encode("utf-8"))
+        assert config == _EXPECTED_FULL_CONFIG
+
+
+def _check_default_values(config: BridgeConfig) -> None:
+    """Assert defaults are used when no env vars are set."""
+    assert config.local_broker.host == "127.0.0.1"
+    assert config.local_broker.port == 1883
+
+
+def _check_local_broker(config: BridgeConfig) -> None:
+    """Assert local broker fields come from the environment."""
+    assert config.local_broker.host == "192.168.1.50"
+    assert config.local_broker.port == 1884
+    assert config.local_broker.username == "testuser"
+    assert config.local_broker.password == "testpass"
+
+
+def _check_single_remote(config: BridgeConfig) -> None:
+    """Assert a single remote broker is built from individual env vars."""
+    assert len(config.remote_brokers) == 1
+    remote = config.remote_brokers[0]
+    assert remote.host == "remote.example.com"
+    assert remote.port == 8883
+    assert remote.name == "cloud"
+    assert remote.tls.enabled is True
+
+
+def _check_remote_brokers_json(config: BridgeConfig) -> None:
+    """Assert multiple remote brokers parse from the JSON env var."""
+    assert len(config.remote_brokers) == 2
+    assert config.remote_brokers[0].name == "broker1"
+    assert config.remote_brokers[1].name == "broker2"
+    assert config.remote_brokers[1].port == 8884
+
+
+def _check_topic_format(config: BridgeConfig) -> None:
+    """Assert the local topic format comes from the environment."""
+    assert config.local_broker.topics.format.value == "scada"
+
+
+def _check_filter_lists(config: BridgeConfig) -> None:
+    """Assert comma-separated filter lists are split correctly."""
+    assert len(config.remote_brokers) == 1
+    remote = config.remote_brokers[0]
+    assert len(remote.message_filter.deveui_whitelist) == 2
+    assert len(remote.field_filter.exclude_fields) == 3
+
+
+def _check_invalid_remote_json(config: BridgeConfig) -> None:
+    """Assert invalid REMOTE_BROKERS JSON yields no remote brokers."""
+    assert config.remote_brokers == []
+
+
+# (env vars to set, assertions to run) — one load_config_from_env call
+# and one config construction per scenario
+_ENV_CASES = [
+    pytest.param({}, _check_default_values, id="default_values"),
+    pytest.param(
+        {
+            "LORA_MQTT_BRIDGE_LOCAL_HOST": "192.168.1.50",
+            "LORA_MQTT_BRIDGE_LOCAL_PORT": "1884",
+            "LORA_MQTT_BRIDGE_LOCAL_USERNAME": "testuser",
+            "LORA_MQTT_BRIDGE_LOCAL_PASSWORD": "testpass",
+        },
+        _check_local_broker,
+        id="local_broker",
+    ),
+    pytest.param(
+        {
+            "LORA_MQTT_BRIDGE_REMOTE_HOST": "remote.example.com",
+            "LORA_MQTT_BRIDGE_REMOTE_PORT": "8883",
+            "LORA_MQTT_BRIDGE_REMOTE_NAME": "cloud",
+            "LORA_MQTT_BRIDGE_REMOTE_TLS_ENABLED": "true",
+        },
+        _check_single_remote,
+        id="single_remote_broker",
+    ),
+    pytest.param(
+        {
+            "LORA_MQTT_BRIDGE_REMOTE_BROKERS": json.dumps(
+                [
+                    {"name": "broker1", "host": "broker1.example.com"},
+                    {"name": "broker2", "host": "broker2.example.com", "port": 8884},
+                ]
+            ),
+        },
+        _check_remote_brokers_json,
+        id="remote_brokers_json",
+    ),
+    pytest.param(
+        {
+            "LORA_MQTT_BRIDGE_LOCAL_TOPIC_FORMAT": "scada",
+            "LORA_MQTT_BRIDGE_LOCAL_UPLINK_PATTERN": "scada/+/up",
+            "LORA_MQTT_BRIDGE_LOCAL_DOWNLINK_PATTERN": "scada/%s/down",
+        },
+        _check_topic_format,
+        id="topic_format",
+    ),
+    pytest.param(
+        {
+            "LORA_MQTT_BRIDGE_REMOTE_HOST": "remote.example.com",
+            "LORA_MQTT_BRIDGE_REMOTE_DEVEUI_WHITELIST": (
+                "00-11-22-33-44-55-66-77,aa-bb-cc-dd-ee-ff-00-11"
+            ),
+            "LORA_MQTT_BRIDGE_REMOTE_EXCLUDE_FIELDS": "rssi,snr,freq",
+        },
+        _check_filter_lists,
+        id="filter_lists",
+    ),
+    pytest.param(
+        # Invalid JSON should not raise, just yield an empty broker list
+        {"LORA_MQTT_BRIDGE_REMOTE_BROKERS": "not valid json"},
+        _check_invalid_remote_json,
+        id="invalid_remote_brokers_json",
+    ),
+]
 
-        assert config.local_broker.topics.format.value == "scada"
 
-    def test_filter_lists_from_env(self, monkeypatch: MonkeyPatch) -> None:
-        """Test loading filter lists from environment.
+class TestLoadConfigFromEnv:
+    """Tests for load_config_from_env function.
 
-        Args:
-            monkeypatch: Pytest monkeypatch fixture.
-        """
-        monkeypatch.setenv("LORA_MQTT_BRIDGE_REMOTE_HOST", "remote.example.com")
-        monkeypatch.setenv(
-            "LORA_MQTT_BRIDGE_REMOTE_DEVEUI_WHITELIST",
-            "00-11-22-33-44-55-66-77,aa-bb-cc-dd-ee-ff-00-11",
-        )
-        monkeypatch.setenv(
-            "LORA_MQTT_BRIDGE_REMOTE_EXCLUDE_FIELDS",
-            "rssi,snr,freq",
-        )
+    Environment mutation is process-global, so these run serially
+    (one xdist worker); the file-based tests above fan out freely.
+    """
 
-        config = load_config_from_env()
+    pytestmark = pytest.mark.serial
 
-        assert len(config.remote_brokers) == 1
-        remote = config.remote_brokers[0]
-        assert len(remote.message_filter.deveui_whitelist) == 2
-        assert len(remote.field_filter.exclude_fields) == 3
+    @pytest.mark.usefixtures("clean_bridge_env")
+    @pytest.mark.parametrize(("env", "check"), _ENV_CASES)
+    def test_env_scenarios(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        env: dict[str, str],
+        check: Callable[[BridgeConfig], None],
+    ) -> None:
+        """Test loading configuration from environment variables.
 
-    def test_invalid_json_remote_brokers(self, monkeypatch: MonkeyPatch) -> None:
-        """Test handling invalid JSON in REMOTE_BROKERS env var.
+        Each scenario sets its env block, builds the config once, and
+        runs all of its assertions against that single instance.
 
         Args:
             monkeypatch: Pytest monkeypatch fixture.
+            env: Environment variables to set for the scenario.
+            check: Assertion callback run against the loaded config.
         """
-        monkeypatch.setenv("LORA_MQTT_BRIDGE_REMOTE_BROKERS", "not valid json")
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
 
-        # Should not raise, just return empty list
         config = load_config_from_env()
-        assert config.remote_brokers == []
+        check(config)
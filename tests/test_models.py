@@ -200,6 +200,15 @@ class TestLoRaMessage:
         assert message.deveui == "00-11-22-33-44-55-66-77"
         assert message.appeui == "aa-bb-cc-dd-ee-ff-00-11"
 
+    def test_eui_normalization_is_cached(self) -> None:
+        """Test that repeat EUIs hit the normalization cache."""
+        from lora_mqtt_bridge.models.message import _normalize_eui_cached
+
+        _normalize_eui_cached.cache_clear()
+        assert _normalize_eui_cached("AA:BB:CC:DD:EE:FF:00:11") == "aa-bb-cc-dd-ee-ff-00-11"
+        _normalize_eui_cached("AA:BB:CC:DD:EE:FF:00:11")
+        assert _normalize_eui_cached.cache_info().hits == 1
+
     def test_get_effective_joineui(self) -> None:
         """Test get_effective_joineui method."""
         # With joineui set
@@ -0,0 +1,59 @@
+"""Tests for the status writer.
+
+This module contains tests for StatusWriter's status.json handling.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import TYPE_CHECKING
+
+from lora_mqtt_bridge.utils.status_writer import StatusWriter
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestStatusWriterSkip:
+    """Tests for the unchanged-content write skip."""
+
+    def test_idle_tick_performs_no_write(self, tmp_path: Path) -> None:
+        """Test that a tick with unchanged status does not rewrite the file."""
+        writer = StatusWriter(app_dir=str(tmp_path))
+        writer.set_local_connected(True)
+
+        writer._write_status()
+        first_stat = os.stat(writer.status_file)
+
+        # Same status fields: the idle tick must not touch the file
+        writer._write_status()
+        second_stat = os.stat(writer.status_file)
+        assert second_stat.st_mtime_ns == first_stat.st_mtime_ns
+        assert second_stat.st_ino == first_stat.st_ino
+
+    def test_changed_status_rewrites_file(self, tmp_path: Path) -> None:
+        """Test that a status change is written out on the next tick."""
+        writer = StatusWriter(app_dir=str(tmp_path))
+        writer.set_local_connected(True)
+        writer._write_status()
+
+        writer.set_local_connected(False)
+        writer._write_status()
+
+        with open(writer.status_file) as f:
+            status = json.load(f)
+        assert "Local:DISC" in status["AppInfo"]
+
+    def test_explicit_write_resets_skip_state(self, tmp_path: Path) -> None:
+        """Test that the periodic tick after write_immediate rewrites the file."""
+        writer = StatusWriter(app_dir=str(tmp_path))
+        writer.set_local_connected(True)
+        writer._write_status()
+
+        writer.write_immediate("Stopping...")
+        writer._write_status()
+
+        with open(writer.status_file) as f:
+            status = json.load(f)
+        assert "Local:OK" in status["AppInfo"]